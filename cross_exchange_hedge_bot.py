@@ -4,17 +4,63 @@ Cross-Exchange Hedge Bot - Paradex ↔ Lighter Hedging for Volume Generation
 
 import os
 import asyncio
+import signal
+import time
 import traceback
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import Decimal, ROUND_DOWN
 from typing import Optional, Tuple
 
+import aiohttp
+
+from exchanges.base import OrderSpec
 from exchanges.paradex import ParadexClient
 from exchanges.lighter import LighterClient
 from helpers import TradingLogger
 from helpers.lark_bot import LarkBot
 from helpers.telegram_bot import TelegramBot
 
+# Maximum age of a WebSocket-cached BBO before falling back to REST
+BBO_STALENESS_SECS = 2.0
+
+# Lighter default leverage (actual margin = notional / leverage)
+LIGHTER_LEVERAGE = Decimal('35')
+
+# Lighter reports balances in micro-USDC; multiplying by the scale is
+# cheaper than dividing by Decimal('1e6')
+USDC_SCALE = Decimal('1e-6')
+
+# Multiplying by 0.5 skips the Decimal division path when taking mid prices
+HALF = Decimal('0.5')
+
+
+def _mid(bid: Decimal, ask: Decimal) -> Decimal:
+    """Mid price of a BBO pair; operands are already Decimal at the client boundary."""
+    return (bid + ask) * HALF
+
+# Parsed once at import instead of per calculation
+HUNDRED = Decimal(100)
+
+# Safety margin on required balance: initial margin + maintenance buffer +
+# fees + slippage
+REQUIRED_BALANCE_MULT = Decimal('1.2')
+
+# Notional deviation (in %) beyond which the hedge is considered unbalanced
+MAX_NOTIONAL_DEVIATION_PCT = Decimal('15')
+
+# Force the raw Lighter balance dump even when DEBUG logging is off
+DEBUG_BALANCES = os.getenv('DEBUG_BALANCES') == '1'
+
+# Upper bound on the leg-synchronization delay. The delay trades a little
+# execution skew for simultaneity, but during an emergency close an unhedged
+# leg must never be held open for long, whatever the latency EMA says
+MAX_SYNC_DELAY_SECS = 0.25
+
+# Errors worth retrying inside the placement loops; anything else escapes to
+# the method-level handler which formats the traceback once
+# (TimeoutError covers asyncio.TimeoutError, OSError covers ConnectionError)
+TRANSIENT_NETWORK_ERRORS = (aiohttp.ClientError, TimeoutError, OSError)
+
 
 @dataclass
 class CrossHedgeConfig:
@@ -31,6 +77,47 @@ class CrossHedgeConfig:
     contract_id: str = ''
     tick_size: Decimal = Decimal(0)
 
+    def __post_init__(self):
+        # Single source of truth for reverse-mode semantics: (paradex, lighter)
+        # sides for opening/closing and the per-venue P&L signs
+        if self.reverse:
+            self.open_sides = ('sell', 'buy')   # Paradex SHORT + Lighter LONG
+            self.close_sides = ('buy', 'sell')
+            self.pnl_signs = (-1.0, 1.0)
+            self.mode_desc = "Reverse mode: Paradex SHORT (maker) + Lighter LONG (taker)"
+        else:
+            self.open_sides = ('buy', 'sell')   # Paradex LONG + Lighter SHORT
+            self.close_sides = ('sell', 'buy')
+            self.pnl_signs = (1.0, -1.0)
+            self.mode_desc = "Normal mode: Paradex LONG (maker) + Lighter SHORT (taker)"
+        # Float copies of the stop thresholds for the per-tick check; the
+        # loss bound is stored already negated so the check is one compare
+        self.neg_max_loss_f = -float(self.max_loss_usdc)
+        self.max_profit_f = float(self.max_profit_usdc)
+
+
+@dataclass
+class MinimalClientConfig:
+    """Bare client configuration for exchange clients driven by this bot.
+
+    Includes the fields the clients and their WebSocket managers assign at
+    runtime (market_info, account_index, lighter_client). Deliberately not
+    slotted: dataclass slots need Python 3.10+ and this module still
+    supports 3.9 alongside the Paradex SDK.
+    """
+    ticker: str
+    exchange: str
+    contract_id: object = ''
+    tick_size: Decimal = Decimal(0)
+    close_order_side: str = 'sell'  # Default, will be updated
+    direction: str = 'buy'  # Default
+    quantity: Decimal = Decimal(0)
+    take_profit: Decimal = Decimal(0)
+    market_info: object = None
+    market_index: object = None
+    account_index: object = None
+    lighter_client: object = None
+
 
 @dataclass
 class CrossPositionState:
@@ -45,6 +132,30 @@ class CrossPositionState:
     is_open: bool = False
     emergency_close: bool = False  # Flag for emergency market order close (stop loss/take profit)
 
+    # Float fast-path values precomputed at position open so the 1 s monitor
+    # loop avoids per-tick Decimal construction (Decimal stays at the
+    # order-submission and settlement boundary)
+    paradex_entry_f: float = 0.0
+    lighter_entry_f: float = 0.0
+    pnl_paradex_coef: float = 0.0
+    pnl_lighter_coef: float = 0.0
+
+    def reset(self) -> None:
+        """Clear all fields in place after a close, reusing the instance."""
+        self.paradex_order_id = None
+        self.lighter_order_id = None
+        self.paradex_entry_price = None
+        self.lighter_entry_price = None
+        self.paradex_quantity = None
+        self.lighter_quantity = None
+        self.entry_time = None
+        self.is_open = False
+        self.emergency_close = False
+        self.paradex_entry_f = 0.0
+        self.lighter_entry_f = 0.0
+        self.pnl_paradex_coef = 0.0
+        self.pnl_lighter_coef = 0.0
+
 
 class CrossExchangeHedgeBot:
     """Cross-exchange hedge trading bot for volume generation (Paradex ↔ Lighter)."""
@@ -56,96 +167,141 @@ class CrossExchangeHedgeBot:
         # Position tracking
         self.position = CrossPositionState()
         self.shutdown_requested = False
+        self._shutdown_event = asyncio.Event()
+
+        # Bound in initialize() once the loop is running; avoids the
+        # deprecated asyncio.get_event_loop() lookup on every timestamp
+        self._loop_time = time.monotonic
+
+        # Latest mid prices published by the price-consumer task:
+        # (paradex_mid, lighter_mid, loop timestamp). The decision loop reads
+        # this without awaiting any I/O.
+        self._latest_px = None
+        self._px_updated = asyncio.Event()
+        self._price_task = None
+
+        # Bounded notification queue drained by a background worker so the
+        # trading path never awaits a webhook POST; created in initialize()
+        self._notify_q = None
+        self._notify_task = None
+        self._dropped_notifications = 0
+
+        # Pre-bound per-venue contract ids and market-order methods, set in
+        # initialize() so hot paths skip the self.a.b.c attribute chains
+        self._paradex_contract = ''
+        self._lighter_contract = ''
+        self._paradex_place = None
+        self._lighter_place = None
+        self._paradex_increment = Decimal(0)
+
+        # EMA of market-order round-trip times per venue, used to synchronize
+        # concurrent leg submissions (faster venue is delayed by the latency gap)
+        self._send_latency_ema = {'paradex': None, 'lighter': None}
+
+        # Absolute notional deviation (in USDC) that maps to the percentage
+        # warning threshold, precomputed so the per-open check is one compare
+        self._deviation_abs_threshold = config.margin * MAX_NOTIONAL_DEVIATION_PCT / HUNDRED
+
+        # Notification credentials are read once; the bot clients themselves are
+        # created in initialize() and kept alive so alerts reuse one connection
+        self._lark_token = os.getenv("LARK_TOKEN")
+        self._telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        self._telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
+        self._lark_bot = None
+        self._tg_bot = None
 
         # Create separate clients for Paradex and Lighter
         self.paradex_client = None
         self.lighter_client = None
 
-    def _create_client_config(self, ticker: str, exchange: str) -> object:
+    def _create_client_config(self, ticker: str, exchange: str) -> MinimalClientConfig:
         """Create configuration for an exchange client instance."""
-        class MinimalConfig:
-            def __init__(self, ticker, exchange):
-                self.ticker = ticker
-                self.contract_id = ''
-                self.tick_size = Decimal(0)
-                self.close_order_side = 'sell'  # Default, will be updated
-                self.direction = 'buy'  # Default
-                self.quantity = Decimal(0)
-                self.take_profit = Decimal(0)
-                self.exchange = exchange
-                self.market_info = None
-                self.market_index = None
-                self.account_index = None
-
-        return MinimalConfig(ticker, exchange)
+        return MinimalClientConfig(ticker=ticker, exchange=exchange)
 
     async def initialize(self):
         """Initialize both Paradex and Lighter clients."""
         try:
             self.logger.log("Initializing Paradex and Lighter clients...", "INFO")
 
-            # Initialize Paradex Client
-            self.logger.log("Connecting to Paradex...", "INFO")
-            paradex_config = self._create_client_config(self.config.ticker, 'paradex')
-            self.paradex_client = ParadexClient(paradex_config)
-            await self.paradex_client.connect()
+            # Bind the running loop's clock once; every later timestamp is a
+            # plain method call instead of an event-loop lookup
+            self._loop_time = asyncio.get_running_loop().time
 
-            # Get Paradex contract attributes
-            paradex_contract_id, paradex_tick_size = await self.paradex_client.get_contract_attributes()
-            self.logger.log(f"Paradex: {self.config.ticker} = {paradex_contract_id}", "INFO")
+            # Create persistent notification clients once so every alert reuses
+            # the same keep-alive connection instead of a fresh TLS handshake
+            if self._lark_token and self._lark_bot is None:
+                self._lark_bot = LarkBot(self._lark_token)
+                await self._lark_bot.__aenter__()
+            if self._telegram_token and self._telegram_chat_id and self._tg_bot is None:
+                self._tg_bot = TelegramBot(self._telegram_token, self._telegram_chat_id)
+
+            # Background worker keeps webhook latency off the trading path
+            self._notify_q = asyncio.Queue(maxsize=100)
+            self._notify_task = asyncio.create_task(self._notify_worker())
 
-            # Initialize Lighter Client
-            self.logger.log("Connecting to Lighter...", "INFO")
+            # Create both clients up front; their I/O is independent so the
+            # metadata lookups and connects run concurrently
+            paradex_config = self._create_client_config(self.config.ticker, 'paradex')
+            self.paradex_client = ParadexClient(paradex_config)
 
             # Debug: Print Lighter credentials
-            import os
             lighter_account_index = os.getenv('LIGHTER_ACCOUNT_INDEX', 'NOT SET')
             lighter_api_key_index = os.getenv('LIGHTER_API_KEY_INDEX', 'NOT SET')
             api_key_exists = 'YES' if os.getenv('API_KEY_PRIVATE_KEY') else 'NO'
             self.logger.log(f"[DEBUG] Lighter Config: ACCOUNT_INDEX={lighter_account_index}, "
                           f"API_KEY_INDEX={lighter_api_key_index}, API_KEY_EXISTS={api_key_exists}", "INFO")
 
-            # Create Lighter config
             lighter_config = self._create_client_config(self.config.ticker, 'lighter')
             self.lighter_client = LighterClient(lighter_config)
 
-            # CRITICAL: Get contract_id BEFORE connecting to ensure WebSocket subscribes to correct channel
-            # This must be done before connect() because WebSocket uses contract_id for subscription
-            lighter_contract_id, lighter_tick_size = await self.lighter_client.get_contract_attributes()
+            # Resolve contract metadata for both venues in parallel.
+            # CRITICAL: this happens BEFORE connect() so the Lighter WebSocket
+            # subscribes to the correct market channel.
+            ((paradex_contract_id, paradex_tick_size),
+             (lighter_contract_id, lighter_tick_size)) = await asyncio.gather(
+                self.paradex_client.get_contract_attributes(),
+                self.lighter_client.get_contract_attributes()
+            )
+            self.logger.log(f"Paradex: {self.config.ticker} = {paradex_contract_id}", "INFO")
             self.logger.log(f"Lighter: {self.config.ticker} = Market ID {lighter_contract_id}", "INFO")
 
             # Set contract_id in client config BEFORE connecting
             self.lighter_client.config.contract_id = lighter_contract_id
             self.lighter_client.config.tick_size = lighter_tick_size
 
-            # Now connect with correct contract_id set
-            await self.lighter_client.connect()
+            # Connect both exchanges concurrently - startup is bounded by the
+            # slower venue instead of the sum
+            self.logger.log("Connecting to Paradex and Lighter...", "INFO")
+            await asyncio.gather(self.paradex_client.connect(), self.lighter_client.connect())
+
+            # Pre-warm the order submission paths so the first live order
+            # doesn't pay the TCP+TLS handshake cost
+            await asyncio.gather(self.paradex_client.warmup(), self.lighter_client.warmup())
 
             # Store contract info (use Paradex's for general config)
             self.config.contract_id = paradex_contract_id
             self.config.tick_size = paradex_tick_size
 
-            # Wait for WebSocket connections to be fully established
-            self.logger.log("Waiting for WebSocket connections to establish...", "INFO")
-            await asyncio.sleep(10)
-
-            # Verify WebSocket connections are ready
-            max_retries = 10
-            for i in range(max_retries):
-                paradex_ready = True  # Paradex usually ready immediately
-                lighter_ready = (hasattr(self.lighter_client, 'ws_manager') and
-                                self.lighter_client.ws_manager and
-                                self.lighter_client.ws_manager.best_bid)
-
-                if lighter_ready:
-                    self.logger.log("WebSocket connections established and data streaming", "INFO")
-                    break
-                else:
-                    self.logger.log(f"Waiting for Lighter WebSocket data... ({i+1}/{max_retries})", "INFO")
-                    await asyncio.sleep(2)
-
-            if not lighter_ready:
-                self.logger.log("Warning: Lighter WebSocket may not be fully ready", "WARNING")
+            # Bind the values and methods the hot paths need so each use is a
+            # single attribute load instead of a lookup chain
+            self._paradex_contract = paradex_contract_id
+            self._lighter_contract = lighter_contract_id
+            self._paradex_place = self.paradex_client.place_market_order
+            self._lighter_place = self.lighter_client.place_market_order
+            self._paradex_increment = self.paradex_client.order_size_increment
+
+            # Wait for the first BBO frame from each venue instead of a flat
+            # 10 s sleep - startup proceeds the moment data is streaming
+            self.logger.log("Waiting for WebSocket market data...", "INFO")
+            waiters = [event.wait() for event in (self.paradex_client.price_tick_event,
+                                                  self.lighter_client.price_tick_event)
+                       if event is not None]
+            try:
+                if waiters:
+                    await asyncio.wait_for(asyncio.gather(*waiters), timeout=20)
+                self.logger.log("WebSocket connections established and data streaming", "INFO")
+            except asyncio.TimeoutError:
+                self.logger.log("Warning: WebSocket feeds may not be fully ready", "WARNING")
 
             # Note: Balance check removed - leverage is set at exchange account level
             # Exchange APIs will return error if insufficient margin for the position
@@ -161,62 +317,21 @@ class CrossExchangeHedgeBot:
     async def _check_account_balances(self):
         """Check account balances on both exchanges and terminate if insufficient."""
         try:
-            # Get balances
-            paradex_balance = await self.paradex_client.get_account_balance()
-
-            # ========== Lighter Balance Debugging ==========
-            import lighter
-            account_api = lighter.AccountApi(self.lighter_client.api_client)
-            account_data = await account_api.account(
-                by="index",
-                value=str(self.lighter_client.account_index)
+            # Get balances (independent requests, fetch concurrently)
+            paradex_balance, lighter_balance = await asyncio.gather(
+                self.paradex_client.get_account_balance(),
+                self.lighter_client.get_account_balance()
             )
 
-            self.logger.log(f"[DEBUG] Lighter API Response:", "INFO")
-            self.logger.log(f"  - account_data type: {type(account_data)}", "INFO")
-            self.logger.log(f"  - account_data.total: {account_data.total}", "INFO")
-            self.logger.log(f"  - account_data.accounts length: {len(account_data.accounts)}", "INFO")
-
-            if account_data.accounts:
-                acc = account_data.accounts[0]
-                self.logger.log(f"  - available_balance: {acc.available_balance}", "INFO")
-                self.logger.log(f"  - collateral: {acc.collateral}", "INFO")
-                self.logger.log(f"  - total_asset_value: {acc.total_asset_value}", "INFO")
-                self.logger.log(f"  - cross_asset_value: {acc.cross_asset_value}", "INFO")
-
-                # Test different interpretations
-                if acc.available_balance is not None:
-                    try:
-                        avail_as_decimal = Decimal(acc.available_balance)
-                        avail_divided = avail_as_decimal / Decimal('1e6')
-                        self.logger.log(f"  - available_balance as Decimal: {avail_as_decimal}", "INFO")
-                        self.logger.log(f"  - available_balance / 1e6: {avail_divided}", "INFO")
-                    except Exception as e:
-                        self.logger.log(f"  - Error parsing available_balance: {e}", "ERROR")
-
-                try:
-                    collateral_as_decimal = Decimal(acc.collateral)
-                    collateral_divided = collateral_as_decimal / Decimal('1e6')
-                    self.logger.log(f"  - collateral as Decimal: {collateral_as_decimal}", "INFO")
-                    self.logger.log(f"  - collateral / 1e6: {collateral_divided}", "INFO")
-                except Exception as e:
-                    self.logger.log(f"  - Error parsing collateral: {e}", "ERROR")
-
-                try:
-                    total_asset_as_decimal = Decimal(acc.total_asset_value)
-                    total_asset_divided = total_asset_as_decimal / Decimal('1e6')
-                    self.logger.log(f"  - total_asset_value as Decimal: {total_asset_as_decimal}", "INFO")
-                    self.logger.log(f"  - total_asset_value / 1e6: {total_asset_divided}", "INFO")
-                except Exception as e:
-                    self.logger.log(f"  - Error parsing total_asset_value: {e}", "ERROR")
-            # ========== End Debugging ==========
-
-            lighter_balance = await self.lighter_client.get_account_balance()
+            # Raw Lighter account dump - only pay the extra API call and the
+            # ~20 formatted log lines when DEBUG logging is actually enabled
+            if DEBUG_BALANCES or self.logger.enabled_for("DEBUG"):
+                await self._debug_lighter_balance()
 
             # Calculate required balance with more reasonable safety margin
             # 1.2x accounts for: initial margin + maintenance margin buffer + fees + slippage
             # Original 2x was overly conservative and blocked valid trades
-            required_balance = self.config.margin * Decimal('1.2')
+            required_balance = self.config.margin * REQUIRED_BALANCE_MULT
 
             self.logger.log(f"Paradex balance: {paradex_balance} USDC (required: {required_balance})", "INFO")
             self.logger.log(f"Lighter balance: {lighter_balance} USDC (required: {required_balance})", "INFO")
@@ -240,6 +355,46 @@ class CrossExchangeHedgeBot:
             self.logger.log(f"Error checking account balances: {e}", "ERROR")
             raise
 
+    async def _debug_lighter_balance(self):
+        """Dump the raw Lighter account response for balance troubleshooting."""
+        account_api = self.lighter_client.get_account_api()
+        account_data = await account_api.account(
+            by="index",
+            value=str(self.lighter_client.account_index)
+        )
+
+        # The logger runs at INFO, so an explicit DEBUG_BALANCES opt-in must
+        # emit at INFO or the dump would be paid for and then dropped
+        level = "INFO" if DEBUG_BALANCES else "DEBUG"
+
+        self.logger.log("[DEBUG] Lighter API Response:", level)
+        self.logger.log(f"  - account_data type: {type(account_data)}", level)
+        self.logger.log(f"  - account_data.total: {account_data.total}", level)
+        self.logger.log(f"  - account_data.accounts length: {len(account_data.accounts)}", level)
+
+        if account_data.accounts:
+            acc = account_data.accounts[0]
+            self.logger.log(f"  - available_balance: {acc.available_balance}", level)
+            self.logger.log(f"  - collateral: {acc.collateral}", level)
+            self.logger.log(f"  - total_asset_value: {acc.total_asset_value}", level)
+            self.logger.log(f"  - cross_asset_value: {acc.cross_asset_value}", level)
+
+            def log_scaled(name, raw):
+                if raw is None:
+                    return
+                as_decimal = Decimal(raw)
+                self.logger.log(f"  - {name} as Decimal: {as_decimal}", level)
+                self.logger.log(f"  - {name} / 1e6: {as_decimal * USDC_SCALE}", level)
+
+            # The SDK always returns numeric strings here - one catch around
+            # the whole dump is enough
+            try:
+                log_scaled("available_balance", acc.available_balance)
+                log_scaled("collateral", acc.collateral)
+                log_scaled("total_asset_value", acc.total_asset_value)
+            except Exception as e:
+                self.logger.log(f"  - Error parsing balance fields: {e}", "ERROR")
+
     async def _calculate_quantity_from_margin(self, target_price: Decimal, order_side: str) -> Decimal:
         """Calculate position quantity based on margin and Paradex's actual order price.
 
@@ -253,18 +408,14 @@ class CrossExchangeHedgeBot:
         Returns:
             Position quantity (adjusted for Paradex's order_size_increment precision)
         """
-        # Ensure target_price is Decimal
-        target_price = Decimal(str(target_price))
-
         # Calculate raw quantity based on target margin
         raw_quantity = self.config.margin / target_price
 
-        # Get Paradex's order size increment (precision requirement)
-        paradex_increment = self.paradex_client.order_size_increment
+        # Paradex's order size increment, cached at initialize() time
+        paradex_increment = self._paradex_increment
 
         # CRITICAL: Use ROUND_DOWN to ensure we don't exceed the margin budget
         # This prevents over-allocation and maintains accurate notional value
-        from decimal import ROUND_DOWN
         adjusted_quantity = raw_quantity.quantize(paradex_increment, rounding=ROUND_DOWN)
 
         # Calculate actual notional value after precision truncation
@@ -279,8 +430,8 @@ class CrossExchangeHedgeBot:
         )
 
         # Warn if precision truncation causes significant deviation
-        deviation_pct = abs(actual_notional - self.config.margin) / self.config.margin * Decimal('100')
-        if deviation_pct > Decimal('15'):
+        deviation_pct = abs(actual_notional - self.config.margin) / self.config.margin * HUNDRED
+        if deviation_pct > MAX_NOTIONAL_DEVIATION_PCT:
             self.logger.log(
                 f"⚠️ Precision truncation warning: actual notional deviates {deviation_pct:.2f}% from target margin",
                 "WARNING"
@@ -288,6 +439,39 @@ class CrossExchangeHedgeBot:
 
         return adjusted_quantity
 
+    async def _get_bbo(self, client, contract_id) -> Tuple[Decimal, Decimal]:
+        """Get BBO prices, preferring the WebSocket cache over a REST round-trip.
+
+        Falls back to fetch_bbo_prices when the cached value is missing or
+        older than BBO_STALENESS_SECS.
+        """
+        cached = client.get_cached_bbo()
+        if cached is not None:
+            bid, ask, ts = cached
+            if time.time() - ts <= BBO_STALENESS_SECS:
+                return bid, ask
+        return await client.fetch_bbo_prices(contract_id)
+
+    async def _get_both_bbos(self) -> Tuple[Tuple[Decimal, Decimal], Tuple[Decimal, Decimal]]:
+        """Fetch Paradex and Lighter BBOs concurrently.
+
+        The two lookups are independent, so gathering them costs
+        max(lat_paradex, lat_lighter) instead of the sum.
+        """
+        return await asyncio.gather(
+            self._get_bbo(self.paradex_client, self._paradex_contract),
+            self._get_bbo(self.lighter_client, self._lighter_contract)
+        )
+
+    async def _prefetch_lighter_bbo(self) -> Tuple[Decimal, Decimal, float]:
+        """Fetch the Lighter BBO with a completion timestamp.
+
+        Runs as a background task while the Paradex fill wait is in flight so
+        the hedge leg can reuse the snapshot instead of doing its own lookup.
+        """
+        bid, ask = await self._get_bbo(self.lighter_client, self._lighter_contract)
+        return bid, ask, self._loop_time()
+
     async def _get_average_price(self) -> Decimal:
         """Get average price across both exchanges (for monitoring/logging only).
 
@@ -297,16 +481,12 @@ class CrossExchangeHedgeBot:
         Returns:
             Average mid price (for reference only)
         """
-        # Get Paradex prices
-        paradex_bid, paradex_ask = await self.paradex_client.fetch_bbo_prices(self.config.contract_id)
-        paradex_mid = (Decimal(str(paradex_bid)) + Decimal(str(paradex_ask))) / Decimal('2')
-
-        # Get Lighter prices
-        lighter_bid, lighter_ask = await self.lighter_client.fetch_bbo_prices(self.lighter_client.config.contract_id)
-        lighter_mid = (Decimal(str(lighter_bid)) + Decimal(str(lighter_ask))) / Decimal('2')
+        (paradex_bid, paradex_ask), (lighter_bid, lighter_ask) = await self._get_both_bbos()
+        paradex_mid = _mid(paradex_bid, paradex_ask)
+        lighter_mid = _mid(lighter_bid, lighter_ask)
 
         # Calculate average
-        avg_mid = (paradex_mid + lighter_mid) / Decimal('2')
+        avg_mid = (paradex_mid + lighter_mid) * HALF
 
         self.logger.log(f"Prices: Paradex={paradex_mid}, Lighter={lighter_mid}, Avg={avg_mid}", "INFO")
 
@@ -327,29 +507,22 @@ class CrossExchangeHedgeBot:
         try:
             self.logger.log("=== Opening Cross-Exchange Hedge Positions ===", "INFO")
 
-            # Determine sides based on reverse flag
-            if self.config.reverse:
-                paradex_side = 'sell'  # Paradex SHORT
-                lighter_side = 'buy'   # Lighter LONG
-                mode_desc = "Reverse mode: Paradex SHORT (maker) + Lighter LONG (taker)"
-            else:
-                paradex_side = 'buy'   # Paradex LONG
-                lighter_side = 'sell'  # Lighter SHORT
-                mode_desc = "Normal mode: Paradex LONG (maker) + Lighter SHORT (taker)"
-
-            self.logger.log(mode_desc, "INFO")
+            # Sides precomputed from the reverse flag in CrossHedgeConfig
+            paradex_side, lighter_side = self.config.open_sides
+            self.logger.log(self.config.mode_desc, "INFO")
 
             # Dynamic retry loop for Paradex open order (infinite retries until filled)
             retry_timeout = 10  # 10 seconds per attempt
             paradex_result = None
             filled = False
             attempt = 0
+            lighter_bbo_task = None
 
             while not filled and not self.shutdown_requested:
                 attempt += 1
 
                 # Get fresh BBO prices for each attempt
-                paradex_bid, paradex_ask = await self.paradex_client.fetch_bbo_prices(self.config.contract_id)
+                paradex_bid, paradex_ask = await self._get_bbo(self.paradex_client, self._paradex_contract)
 
                 # Calculate Paradex's actual order price (same logic as paradex.py:get_order_price)
                 if paradex_side == 'buy':
@@ -371,11 +544,11 @@ class CrossExchangeHedgeBot:
                 # Calculate quantity based on Paradex's actual order price (recalculate each time for accuracy)
                 quantity = await self._calculate_quantity_from_margin(paradex_order_price, paradex_side)
 
-                # Log attempt
+                # Log attempt (%-args defer formatting to the logger)
                 self.logger.log(
-                    f"Attempt {attempt}: Placing Paradex {paradex_side.upper()} POST_ONLY @ {paradex_order_price} "
-                    f"(bid={paradex_bid}, ask={paradex_ask}, qty={quantity})",
-                    "INFO"
+                    "Attempt %d: Placing Paradex %s POST_ONLY @ %s (bid=%s, ask=%s, qty=%s)",
+                    "INFO", attempt, paradex_side.upper(), paradex_order_price,
+                    paradex_bid, paradex_ask, quantity
                 )
 
                 # Place POST_ONLY limit order on Paradex
@@ -383,7 +556,7 @@ class CrossExchangeHedgeBot:
                     paradex_result = await self.paradex_client.place_open_order(
                         self.config.contract_id, quantity, paradex_side
                     )
-                except Exception as e:
+                except TRANSIENT_NETWORK_ERRORS as e:
                     self.logger.log(f"Paradex order placement failed: {e}, retrying...", "ERROR")
                     await asyncio.sleep(0.5)
                     continue
@@ -393,26 +566,31 @@ class CrossExchangeHedgeBot:
                     await asyncio.sleep(0.5)
                     continue
 
-                # Wait for order to fill (3 seconds timeout)
-                start_time = asyncio.get_event_loop().time()
-
-                while asyncio.get_event_loop().time() - start_time < retry_timeout:
-                    order_info = await self.paradex_client.get_order_info(paradex_result.order_id)
+                # Seed the Paradex latency EMA from the open order so the
+                # sync delays have both venues before the first close
+                if self.paradex_client.last_submit_latency is not None:
+                    self._record_send_latency('paradex', self.paradex_client.last_submit_latency)
 
-                    if order_info and order_info.status == 'CLOSED' and order_info.filled_size > 0:
-                        filled = True
-                        paradex_result.filled_size = order_info.filled_size
-                        paradex_result.price = order_info.price
-                        self.logger.log(
-                            f"✓ Paradex open order filled on attempt {attempt}: "
-                            f"{order_info.filled_size} @ {order_info.price}",
-                            "INFO"
-                        )
-                        break
+                # Prefetch the Lighter BBO while we wait for the Paradex fill
+                # so the hedge leg doesn't pay its own lookup after the fill
+                lighter_bbo_task = asyncio.create_task(self._prefetch_lighter_bbo())
 
-                    await asyncio.sleep(0.2)  # Check every 200ms
+                # Wait for the WS-pushed fill; fall back to a REST check on
+                # timeout in case the push was missed
+                order_info = await self.paradex_client.wait_for_fill(
+                    paradex_result.order_id, timeout=retry_timeout)
+                if order_info is None:
+                    order_info = await self.paradex_client.get_order_info(paradex_result.order_id)
 
-                if filled:
+                if order_info and order_info.status == 'CLOSED' and order_info.filled_size > 0:
+                    filled = True
+                    paradex_result.filled_size = order_info.filled_size
+                    paradex_result.price = order_info.price
+                    self.logger.log(
+                        f"✓ Paradex open order filled on attempt {attempt}: "
+                        f"{order_info.filled_size} @ {order_info.price}",
+                        "INFO"
+                    )
                     break
 
                 # Not filled within timeout - cancel and retry
@@ -430,14 +608,29 @@ class CrossExchangeHedgeBot:
                 self.logger.log("Opening positions interrupted by shutdown request", "WARNING")
                 return False
 
+            # Consume the BBO prefetched during the fill wait (only if still fresh)
+            lighter_bbo = None
+            if lighter_bbo_task is not None:
+                try:
+                    bid, ask, fetched_at = await lighter_bbo_task
+                    if self._loop_time() - fetched_at < BBO_STALENESS_SECS and 0 < bid < ask:
+                        lighter_bbo = (bid, ask)
+                except Exception as e:
+                    self.logger.log(f"Lighter BBO prefetch failed: {e}", "WARNING")
+
             # Step 2: Immediately place Lighter market order to hedge
             self.logger.log(f"Placing Lighter {lighter_side.upper()} market order to hedge...", "INFO")
             try:
-                lighter_result = await self.lighter_client.place_market_order(
-                    self.lighter_client.config.contract_id,
+                lighter_result = await self._lighter_place(
+                    self._lighter_contract,
                     paradex_result.filled_size,  # Use actual filled size from Paradex
-                    lighter_side
+                    lighter_side,
+                    bbo=lighter_bbo
                 )
+                # Submission-only latency recorded by the client; wall time
+                # around the call would also include the fill wait
+                if self.lighter_client.last_submit_latency is not None:
+                    self._record_send_latency('lighter', self.lighter_client.last_submit_latency)
             except Exception as e:
                 self.logger.log(f"Lighter hedge failed: {e}", "ERROR")
                 # Rollback Paradex position
@@ -458,54 +651,104 @@ class CrossExchangeHedgeBot:
             self.position.lighter_entry_price = lighter_result.price
             self.position.paradex_quantity = paradex_result.filled_size
             self.position.lighter_quantity = lighter_result.filled_size or paradex_result.filled_size
-            self.position.entry_time = asyncio.get_event_loop().time()
+            self.position.entry_time = self._loop_time()
             self.position.is_open = True
 
+            # Precompute float P&L coefficients for the hot monitor path:
+            # per-leg pnl = coef * (current_price - entry_price)
+            paradex_sign, lighter_sign = self.config.pnl_signs
+            self.position.paradex_entry_f = float(self.position.paradex_entry_price)
+            self.position.lighter_entry_f = float(self.position.lighter_entry_price)
+            self.position.pnl_paradex_coef = paradex_sign * float(self.position.paradex_quantity)
+            # Lighter P&L is computed on actual margin (notional / leverage):
+            # margin * sign * (px - entry) / entry == sign * qty / leverage * (px - entry)
+            self.position.pnl_lighter_coef = lighter_sign * float(self.position.lighter_quantity) / float(LIGHTER_LEVERAGE)
+
             # ========== Calculate and verify actual notional values ==========
+            # Two multiplications on the critical path; the percentage math
+            # only runs inside _maybe_warn_deviation when a leg is actually
+            # outside the precomputed absolute threshold
             paradex_notional = self.position.paradex_quantity * self.position.paradex_entry_price
             lighter_notional = self.position.lighter_quantity * self.position.lighter_entry_price
             target_margin = self.config.margin
 
-            # Calculate deviations
-            paradex_deviation_pct = abs(paradex_notional - target_margin) / target_margin * Decimal('100')
-            lighter_deviation_pct = abs(lighter_notional - target_margin) / target_margin * Decimal('100')
-
             self.logger.log(f"✓ Paradex {paradex_side.upper()} (maker): {self.position.paradex_quantity} @ {self.position.paradex_entry_price}", "INFO")
             self.logger.log(f"✓ Lighter {lighter_side.upper()} (taker): {self.position.lighter_quantity} @ {self.position.lighter_entry_price}", "INFO")
 
-            # Log notional values with color-coded warnings
-            self.logger.log(
-                f"📊 Notional values - Target: {target_margin:.2f} USDC | "
-                f"Paradex: {paradex_notional:.2f} USDC ({paradex_deviation_pct:+.2f}%) | "
-                f"Lighter: {lighter_notional:.2f} USDC ({lighter_deviation_pct:+.2f}%)",
-                "INFO"
-            )
-
-            # Warn if deviations are significant
-            if paradex_deviation_pct > Decimal('15'):
+            if self.logger.enabled_for("INFO"):
                 self.logger.log(
-                    f"⚠️ Paradex notional deviation: {paradex_deviation_pct:.2f}% "
-                    f"(actual: {paradex_notional:.2f}, target: {target_margin:.2f})",
-                    "WARNING"
+                    f"📊 Notional values - Target: {target_margin:.2f} USDC | "
+                    f"Paradex: {paradex_notional:.2f} USDC | "
+                    f"Lighter: {lighter_notional:.2f} USDC",
+                    "INFO"
                 )
 
-            if lighter_deviation_pct > Decimal('15'):
-                self.logger.log(
-                    f"⚠️ Lighter notional deviation: {lighter_deviation_pct:.2f}% "
-                    f"(actual: {lighter_notional:.2f}, target: {target_margin:.2f})",
-                    "WARNING"
-                )
+            self._maybe_warn_deviation("Paradex", paradex_notional)
+            self._maybe_warn_deviation("Lighter", lighter_notional)
 
             self.logger.log("=== Cross-Exchange Hedge Positions Opened Successfully ===", "INFO")
             # ========== END verification ==========
 
             return True
 
+        except TRANSIENT_NETWORK_ERRORS as e:
+            # Known-transient failure: skip the (expensive) stack walk
+            self.logger.log(f"Network error opening hedge positions: {e}", "ERROR")
+            return False
         except Exception as e:
             self.logger.log(f"Error opening hedge positions: {e}", "ERROR")
             self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
             return False
 
+    def _maybe_warn_deviation(self, venue: str, notional: Decimal):
+        """Warn when a leg's notional deviates too far from the target margin.
+
+        Early-exits on the precomputed absolute threshold so the common
+        (in-range) case costs one subtraction and one compare.
+        """
+        target_margin = self.config.margin
+        if abs(notional - target_margin) <= self._deviation_abs_threshold:
+            return
+        deviation_pct = abs(notional - target_margin) / target_margin * HUNDRED
+        self.logger.log(
+            f"⚠️ {venue} notional deviation: {deviation_pct:.2f}% "
+            f"(actual: {notional:.2f}, target: {target_margin:.2f})",
+            "WARNING"
+        )
+
+    def _record_send_latency(self, venue: str, rtt: float):
+        """Update the EMA of order submission latency for a venue.
+
+        Fed from the clients' ``last_submit_latency`` (the submission call
+        only) - fill waits must stay out of the EMA or one slow fill would
+        be read as seconds of network latency.
+        """
+        prev = self._send_latency_ema.get(venue)
+        self._send_latency_ema[venue] = rtt if prev is None else prev + 0.3 * (rtt - prev)
+
+    def _sync_send_delays(self) -> Tuple[float, float]:
+        """Compute per-venue send delays so concurrent legs execute together.
+
+        Delays the faster venue by the estimated one-way latency gap, so both
+        orders land in their matching engines at roughly the same wall-clock
+        moment instead of skewed by the submission-latency difference. The
+        delay is capped at MAX_SYNC_DELAY_SECS so a bad estimate can never
+        hold one leg of an emergency close open for long.
+
+        Returns:
+            Tuple of (paradex_delay, lighter_delay) in seconds
+        """
+        paradex_rtt = self._send_latency_ema.get('paradex')
+        lighter_rtt = self._send_latency_ema.get('lighter')
+        if paradex_rtt is None or lighter_rtt is None:
+            return 0.0, 0.0
+
+        # One-way gap: positive means Paradex is slower, so delay Lighter
+        gap = (paradex_rtt - lighter_rtt) / 2
+        if gap > 0:
+            return 0.0, min(gap, MAX_SYNC_DELAY_SECS)
+        return min(-gap, MAX_SYNC_DELAY_SECS), 0.0
+
     async def _rollback_paradex_position(self, order_result, close_side: str):
         """Rollback a Paradex position by immediately closing it.
 
@@ -538,21 +781,34 @@ class CrossExchangeHedgeBot:
         try:
             self.logger.log("⚡ Executing EMERGENCY MARKET CLOSE on both exchanges", "WARNING")
 
-            # Close both positions simultaneously with market orders
-            paradex_task = self.paradex_client.place_market_order(
-                self.config.contract_id,
-                self.position.paradex_quantity,
-                paradex_close_side
-            )
-
-            lighter_task = self.lighter_client.place_market_order(
-                self.lighter_client.config.contract_id,
-                self.position.lighter_quantity,
-                lighter_close_side
-            )
-
-            # Execute both market orders in parallel
-            paradex_result, lighter_result = await asyncio.gather(paradex_task, lighter_task, return_exceptions=True)
+            # Synchronize the two legs: delay the faster venue by the measured
+            # latency gap so both orders execute at roughly the same moment
+            paradex_delay, lighter_delay = self._sync_send_delays()
+
+            async def timed_leg(venue: str, delay: float, client, specs):
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                batch = await client.place_market_orders_batch(specs)
+                # The client recorded the submission call's duration; wall
+                # time here would also include the fill wait
+                if client.last_submit_latency is not None:
+                    self._record_send_latency(venue, client.last_submit_latency)
+                return batch
+
+            # Close both positions simultaneously - one batched submission per exchange
+            # so each venue sees a single execution window instead of one RTT per order
+            paradex_task = timed_leg('paradex', paradex_delay, self.paradex_client, [
+                OrderSpec(self.config.contract_id, self.position.paradex_quantity, paradex_close_side)
+            ])
+
+            lighter_task = timed_leg('lighter', lighter_delay, self.lighter_client, [
+                OrderSpec(self._lighter_contract, self.position.lighter_quantity, lighter_close_side)
+            ])
+
+            # Execute both batches in parallel and unpack each leg result
+            paradex_batch, lighter_batch = await asyncio.gather(paradex_task, lighter_task)
+            paradex_result = paradex_batch[0]
+            lighter_result = lighter_batch[0]
 
             # Check Paradex result
             if isinstance(paradex_result, Exception):
@@ -575,7 +831,7 @@ class CrossExchangeHedgeBot:
                 await self.send_notification(f"🚨 CRITICAL: Lighter emergency close status: {lighter_result.status}")
 
             # Reset position state
-            self.position = CrossPositionState()
+            self.position.reset()
 
             self.logger.log("=== EMERGENCY CLOSE COMPLETED ===", "INFO")
 
@@ -594,61 +850,40 @@ class CrossExchangeHedgeBot:
             return False, ""
 
         try:
-            # Get current prices
-            paradex_bid, paradex_ask = await self.paradex_client.fetch_bbo_prices(self.config.contract_id)
-            paradex_price = (Decimal(str(paradex_bid)) + Decimal(str(paradex_ask))) / Decimal('2')
-
-            lighter_bid, lighter_ask = await self.lighter_client.fetch_bbo_prices(self.lighter_client.config.contract_id)
-            lighter_price = (Decimal(str(lighter_bid)) + Decimal(str(lighter_ask))) / Decimal('2')
-
-            # Calculate absolute P&L in USDC based on direction
-            # NOTE: Paradex uses full margin (no leverage), Lighter uses ~35x leverage
-
-            # Paradex P&L (no leverage, uses full notional value)
-            if self.config.reverse:
-                paradex_pnl_usdc = (self.position.paradex_entry_price - paradex_price) * self.position.paradex_quantity
-            else:
-                paradex_pnl_usdc = (paradex_price - self.position.paradex_entry_price) * self.position.paradex_quantity
-
-            # Lighter P&L (with leverage, need to calculate based on actual margin)
-            # Lighter default leverage is ~35x, so actual margin = notional / 35
-            lighter_leverage = Decimal('35')
-            lighter_notional = self.position.lighter_entry_price * self.position.lighter_quantity
-            lighter_actual_margin = lighter_notional / lighter_leverage
-
-            # Calculate Lighter price change percentage
-            if self.config.reverse:
-                # Lighter LONG
-                lighter_pnl_pct = (lighter_price - self.position.lighter_entry_price) / self.position.lighter_entry_price
+            # Prefer the consumer-task snapshot (no awaits); fall back to a
+            # direct lookup when it is missing or stale
+            latest = self._latest_px
+            if latest is not None and self._loop_time() - latest[2] <= BBO_STALENESS_SECS:
+                paradex_price, lighter_price = latest[0], latest[1]
             else:
-                # Lighter SHORT
-                lighter_pnl_pct = (self.position.lighter_entry_price - lighter_price) / self.position.lighter_entry_price
-
-            # Lighter P&L in USDC = actual margin * price change percentage
-            lighter_pnl_usdc = lighter_actual_margin * lighter_pnl_pct
-
-            # Calculate total P&L
-            total_pnl_usdc = paradex_pnl_usdc + lighter_pnl_usdc
-
-            # Calculate percentage P&L for logging
-            paradex_pnl_pct = (paradex_pnl_usdc / (self.position.paradex_entry_price * self.position.paradex_quantity)) * Decimal('100')
-            # For Lighter, calculate percentage based on actual margin used (with leverage)
-            lighter_display_pnl_pct = (lighter_pnl_usdc / lighter_actual_margin) * Decimal('100')
-
-            self.logger.log(
-                f"P&L: Paradex={paradex_pnl_pct:.2f}% ({paradex_pnl_usdc:+.2f} USDC), "
-                f"Lighter={lighter_display_pnl_pct:.2f}% ({lighter_pnl_usdc:+.2f} USDC, margin={lighter_actual_margin:.2f}), "
-                f"Total={total_pnl_usdc:+.2f} USDC",
-                "INFO"
+                (paradex_bid, paradex_ask), (lighter_bid, lighter_ask) = await self._get_both_bbos()
+                paradex_price = (float(paradex_bid) + float(paradex_ask)) / 2.0
+                lighter_price = (float(lighter_bid) + float(lighter_ask)) / 2.0
+
+            # In a clean hedge the two legs cancel out, so the one number that
+            # matters is the basis skew: the netted P&L across both venues.
+            # Plain float math against coefficients precomputed at position
+            # open - no per-tick Decimal construction. Integer tick math was
+            # considered here, but float and int multiplies cost the same in
+            # CPython and floats avoid the tick-scale bookkeeping; this is
+            # only a stop trigger, so float precision is more than sufficient.
+            # NOTE: Paradex uses full margin (no leverage), Lighter uses ~35x leverage
+            skew_pnl_usdc = (
+                self.position.pnl_paradex_coef * (paradex_price - self.position.paradex_entry_f)
+                + self.position.pnl_lighter_coef * (lighter_price - self.position.lighter_entry_f)
             )
 
-            # Check stop loss (total P&L in USDC)
-            if total_pnl_usdc <= -self.config.max_loss_usdc:
-                return True, f"Stop Loss triggered: {total_pnl_usdc:.2f} USDC (threshold: -{self.config.max_loss_usdc} USDC)"
+            # Per-tick log: %-args defer the formatting until the logger has
+            # confirmed DEBUG output is actually being emitted
+            self.logger.log("Hedge skew P&L: %+.2f USDC", "DEBUG", skew_pnl_usdc)
 
-            # Check take profit (total P&L in USDC)
-            if total_pnl_usdc >= self.config.max_profit_usdc:
-                return True, f"Take Profit triggered: {total_pnl_usdc:.2f} USDC (threshold: +{self.config.max_profit_usdc} USDC)"
+            # Check stop loss (netted P&L in USDC)
+            if skew_pnl_usdc <= self.config.neg_max_loss_f:
+                return True, f"Stop Loss triggered: {skew_pnl_usdc:.2f} USDC (threshold: -{self.config.max_loss_usdc} USDC)"
+
+            # Check take profit (netted P&L in USDC)
+            if skew_pnl_usdc >= self.config.max_profit_f:
+                return True, f"Take Profit triggered: {skew_pnl_usdc:.2f} USDC (threshold: +{self.config.max_profit_usdc} USDC)"
 
             return False, ""
 
@@ -670,13 +905,8 @@ class CrossExchangeHedgeBot:
                 self.logger.log("No open positions to close", "WARNING")
                 return
 
-            # Determine close sides based on reverse flag
-            if self.config.reverse:
-                paradex_close_side = 'buy'   # Close SHORT
-                lighter_close_side = 'sell'  # Close LONG
-            else:
-                paradex_close_side = 'sell'  # Close LONG
-                lighter_close_side = 'buy'   # Close SHORT
+            # Close sides precomputed from the reverse flag in CrossHedgeConfig
+            paradex_close_side, lighter_close_side = self.config.close_sides
 
             # Check if emergency close (stop loss/take profit triggered)
             if self.position.emergency_close:
@@ -690,23 +920,43 @@ class CrossExchangeHedgeBot:
             paradex_close = None
             filled = False
 
+            # Resolve the maker price formula once: selling quotes just above
+            # best bid, buying just below best ask
+            tick = self.config.tick_size
+            if paradex_close_side == 'sell':
+                pick_price = lambda bid, ask: bid + tick
+            else:
+                pick_price = lambda bid, ask: ask - tick
+
+            cancel_task = None
+
             for attempt in range(1, max_retries + 1):
-                # Get fresh BBO prices for each attempt
-                paradex_bid, paradex_ask = await self.paradex_client.fetch_bbo_prices(self.config.contract_id)
+                # Get fresh BBO prices for each attempt, overlapped with the
+                # previous attempt's in-flight cancel (one fewer RTT per
+                # retry); the cancel is settled before the next place goes out
+                if cancel_task is not None:
+                    bbo_result, cancel_result = await asyncio.gather(
+                        self._get_bbo(self.paradex_client, self._paradex_contract),
+                        cancel_task,
+                        return_exceptions=True
+                    )
+                    cancel_task = None
+                    if isinstance(cancel_result, Exception):
+                        self.logger.log(f"Error canceling order: {cancel_result}", "WARNING")
+                    if isinstance(bbo_result, Exception):
+                        raise bbo_result
+                    paradex_bid, paradex_ask = bbo_result
+                else:
+                    paradex_bid, paradex_ask = await self._get_bbo(self.paradex_client, self._paradex_contract)
 
                 # Calculate close price for POST_ONLY order (dynamic price adjustment)
-                if paradex_close_side == 'sell':
-                    # Selling: place slightly above best bid to ensure maker
-                    close_price = paradex_bid + self.config.tick_size
-                else:
-                    # Buying: place slightly below best ask to ensure maker
-                    close_price = paradex_ask - self.config.tick_size
+                close_price = pick_price(paradex_bid, paradex_ask)
 
                 # Place POST_ONLY close order on Paradex
                 self.logger.log(
-                    f"Attempt {attempt}/{max_retries}: Placing Paradex {paradex_close_side.upper()} "
-                    f"POST_ONLY @ {close_price} (bid={paradex_bid}, ask={paradex_ask})...",
-                    "INFO"
+                    "Attempt %d/%d: Placing Paradex %s POST_ONLY @ %s (bid=%s, ask=%s)...",
+                    "INFO", attempt, max_retries, paradex_close_side.upper(),
+                    close_price, paradex_bid, paradex_ask
                 )
 
                 try:
@@ -716,7 +966,7 @@ class CrossExchangeHedgeBot:
                         close_price,
                         paradex_close_side
                     )
-                except Exception as e:
+                except TRANSIENT_NETWORK_ERRORS as e:
                     self.logger.log(f"Paradex close order placement failed: {e}", "ERROR")
                     await asyncio.sleep(0.5)
                     continue
@@ -726,35 +976,37 @@ class CrossExchangeHedgeBot:
                     await asyncio.sleep(0.5)
                     continue
 
-                # Wait for order to fill (3 seconds timeout)
-                start_time = asyncio.get_event_loop().time()
-
-                while asyncio.get_event_loop().time() - start_time < retry_timeout:
+                # Wait for the WS-pushed fill; fall back to a REST check on
+                # timeout in case the push was missed
+                order_info = await self.paradex_client.wait_for_fill(
+                    paradex_close.order_id, timeout=retry_timeout)
+                if order_info is None:
                     order_info = await self.paradex_client.get_order_info(order_id=paradex_close.order_id)
 
-                    if order_info and order_info.status == 'CLOSED' and order_info.filled_size > 0:
-                        filled = True
-                        paradex_close.filled_size = order_info.filled_size
-                        paradex_close.price = order_info.price
-                        self.logger.log(
-                            f"✓ Paradex closed (POST_ONLY) on attempt {attempt}: "
-                            f"{order_info.filled_size} @ {order_info.price}",
-                            "INFO"
-                        )
-                        break
-
-                    await asyncio.sleep(0.2)  # Check every 200ms
-
-                if filled:
+                if order_info and order_info.status == 'CLOSED' and order_info.filled_size > 0:
+                    filled = True
+                    paradex_close.filled_size = order_info.filled_size
+                    paradex_close.price = order_info.price
+                    self.logger.log(
+                        f"✓ Paradex closed (POST_ONLY) on attempt {attempt}: "
+                        f"{order_info.filled_size} @ {order_info.price}",
+                        "INFO"
+                    )
                     break
 
-                # Not filled within 3 seconds - cancel and retry
+                # Not filled within 3 seconds - cancel and retry, letting the
+                # cancel overlap the next attempt's BBO fetch
                 self.logger.log(
                     f"Order not filled within {retry_timeout}s, canceling and retrying...",
                     "INFO"
                 )
+                cancel_task = asyncio.create_task(
+                    self.paradex_client.cancel_order(paradex_close.order_id))
+
+            # Settle a cancel left in flight by the final iteration
+            if cancel_task is not None:
                 try:
-                    await self.paradex_client.cancel_order(paradex_close.order_id)
+                    await cancel_task
                 except Exception as e:
                     self.logger.log(f"Error canceling order: {e}", "WARNING")
 
@@ -778,8 +1030,8 @@ class CrossExchangeHedgeBot:
             # Step 2: Immediately close Lighter position with market order
             self.logger.log(f"Placing Lighter {lighter_close_side.upper()} market close order...", "INFO")
             try:
-                lighter_close = await self.lighter_client.place_market_order(
-                    self.lighter_client.config.contract_id,
+                lighter_close = await self._lighter_place(
+                    self._lighter_contract,
                     self.position.lighter_quantity,
                     lighter_close_side
                 )
@@ -795,26 +1047,139 @@ class CrossExchangeHedgeBot:
                 self.logger.log("⚠️ Paradex closed but Lighter still open - POSITION IMBALANCE", "ERROR")
 
             # Reset position state
-            self.position = CrossPositionState()
+            self.position.reset()
 
             self.logger.log("=== Cross-Exchange Hedge Positions Closed ===", "INFO")
 
+        except TRANSIENT_NETWORK_ERRORS as e:
+            self.logger.log(f"Network error closing hedge positions: {e}", "ERROR")
         except Exception as e:
             self.logger.log(f"Error closing hedge positions: {e}", "ERROR")
             self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
 
+    async def _wait_for_price_tick(self, timeout: float):
+        """Sleep until a new price tick arrives on either venue, or timeout.
+
+        Replaces the fixed 1 s polling delay in the monitor loop: stop
+        conditions are re-checked as soon as the WebSocket delivers a fresh
+        BBO instead of up to a second later. Falls back to a plain sleep when
+        no tick events are available yet.
+        """
+        events = [event for event in (self.paradex_client.price_tick_event,
+                                      self.lighter_client.price_tick_event)
+                  if event is not None]
+        if not events:
+            await asyncio.sleep(timeout)
+            return
+
+        for event in events:
+            event.clear()
+
+        waiters = [asyncio.create_task(event.wait()) for event in events]
+        try:
+            _, pending = await asyncio.wait(waiters, timeout=timeout,
+                                            return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+        except Exception:
+            for task in waiters:
+                task.cancel()
+            raise
+
+    async def _price_consumer(self):
+        """Ingest WebSocket price ticks into self._latest_px.
+
+        Runs as its own task so price frames keep being consumed while the
+        decision loop is busy awaiting order placements; the decision loop
+        reads self._latest_px without any I/O of its own.
+        """
+        while not self.shutdown_requested:
+            try:
+                await self._wait_for_price_tick(1.0)
+
+                paradex_cached = self.paradex_client.get_cached_bbo()
+                lighter_cached = self.lighter_client.get_cached_bbo()
+                if paradex_cached is None or lighter_cached is None:
+                    continue
+
+                now = time.time()
+                if (now - paradex_cached[2] > BBO_STALENESS_SECS or
+                        now - lighter_cached[2] > BBO_STALENESS_SECS):
+                    continue
+
+                paradex_mid = (float(paradex_cached[0]) + float(paradex_cached[1])) / 2.0
+                lighter_mid = (float(lighter_cached[0]) + float(lighter_cached[1])) / 2.0
+                self._latest_px = (paradex_mid, lighter_mid, self._loop_time())
+                self._px_updated.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.log(f"Price consumer error: {e}", "ERROR")
+                await asyncio.sleep(1)
+
+    def request_shutdown(self):
+        """Flag a graceful shutdown and wake any waiting loop immediately."""
+        self.shutdown_requested = True
+        self._shutdown_event.set()
+        # The monitor loop may be parked on the price event
+        self._px_updated.set()
+
+    async def _interruptible_sleep(self, seconds: float):
+        """Sleep that returns early as soon as shutdown is requested."""
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
     async def send_notification(self, message: str):
+        """Queue a notification without blocking the trading path.
+
+        The actual Lark/Telegram posts happen in the background worker so a
+        stalled webhook can never delay an emergency close. Falls back to a
+        direct send if the queue has not been created yet.
+        """
+        if self._notify_q is None:
+            await self._send_notification_now(message)
+            return
+        try:
+            self._notify_q.put_nowait(message)
+        except asyncio.QueueFull:
+            self._dropped_notifications += 1
+            self.logger.log(
+                f"Notification queue full, dropped message (total dropped: {self._dropped_notifications})",
+                "WARNING"
+            )
+
+    async def _notify_worker(self):
+        """Drain the notification queue and perform the actual HTTP posts."""
+        while True:
+            message = await self._notify_q.get()
+            try:
+                await self._send_notification_now(message)
+            except Exception as e:
+                self.logger.log(f"Notification send failed: {e}", "WARNING")
+            finally:
+                self._notify_q.task_done()
+
+    async def _send_notification_now(self, message: str):
         """Send notification via Telegram/Lark."""
-        lark_token = os.getenv("LARK_TOKEN")
-        if lark_token:
-            async with LarkBot(lark_token) as lark_bot:
-                await lark_bot.send_text(message)
+        if self._lark_bot:
+            response = await self._lark_bot.send_text(message)
+            # LarkBot reports transport failures via code -1 instead of
+            # raising; rebuild the long-lived session once and resend in case
+            # the warm connection went stale
+            if response.get("code") == -1:
+                try:
+                    await self._lark_bot.close()
+                except Exception:
+                    pass
+                self._lark_bot = await LarkBot(self._lark_token).__aenter__()
+                await self._lark_bot.send_text(message)
 
-        telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
-        if telegram_token and telegram_chat_id:
-            with TelegramBot(telegram_token, telegram_chat_id) as tg_bot:
-                tg_bot.send_text(message)
+        if self._tg_bot:
+            # TelegramBot is synchronous; push the HTTP round trip onto a
+            # worker thread so it cannot stall the event loop
+            await asyncio.to_thread(self._tg_bot.send_text, message)
 
     async def run(self):
         """Main trading loop - continuous hedge cycle with 20s interval."""
@@ -822,6 +1187,20 @@ class CrossExchangeHedgeBot:
             # Initialize clients
             await self.initialize()
 
+            # Decouple price ingestion from trading decisions: the consumer
+            # task keeps draining WS ticks even while orders are in flight
+            self._price_task = asyncio.create_task(self._price_consumer())
+
+            # Signal-driven shutdown: waking the waits directly bounds the
+            # shutdown latency by in-flight awaits instead of sleep timeouts
+            try:
+                loop = asyncio.get_running_loop()
+                loop.add_signal_handler(signal.SIGINT, self.request_shutdown)
+                loop.add_signal_handler(signal.SIGTERM, self.request_shutdown)
+            except NotImplementedError:
+                # Windows event loop - fall back to KeyboardInterrupt
+                pass
+
             # Log configuration
             self.logger.log("=== Cross-Exchange Hedge Bot Configuration ===", "INFO")
             self.logger.log(f"Ticker: {self.config.ticker}", "INFO")
@@ -842,17 +1221,17 @@ class CrossExchangeHedgeBot:
 
                     if not success:
                         self.logger.log(f"Failed to open positions, retrying in {self.config.cycle_wait} seconds...", "WARNING")
-                        await asyncio.sleep(self.config.cycle_wait)
+                        await self._interruptible_sleep(self.config.cycle_wait)
                         continue
 
                     # Monitor position until hold time expires or stop conditions met
-                    start_time = asyncio.get_event_loop().time()
+                    deadline = self._loop_time() + self.config.hold_time
 
                     while self.position.is_open and not self.shutdown_requested:
                         # Check time
-                        elapsed = asyncio.get_event_loop().time() - start_time
+                        now = self._loop_time()
 
-                        if elapsed >= self.config.hold_time:
+                        if now >= deadline:
                             self.logger.log(f"Hold time expired ({self.config.hold_time}s)", "INFO")
                             break
 
@@ -864,20 +1243,29 @@ class CrossExchangeHedgeBot:
                             self.position.emergency_close = True
                             break
 
-                        # Sleep and check again
-                        await asyncio.sleep(1)
+                        # Wake when the consumer task publishes a fresh price
+                        # (bounded by remaining hold time)
+                        self._px_updated.clear()
+                        try:
+                            await asyncio.wait_for(self._px_updated.wait(),
+                                                   timeout=min(1.0, max(deadline - now, 0.05)))
+                        except asyncio.TimeoutError:
+                            pass
 
                     # Close positions
                     await self._close_hedge_positions()
 
                     # Wait before next cycle
                     self.logger.log(f"Waiting {self.config.cycle_wait} seconds before next cycle...", "INFO")
-                    await asyncio.sleep(self.config.cycle_wait)
+                    await self._interruptible_sleep(self.config.cycle_wait)
 
+                except TRANSIENT_NETWORK_ERRORS as e:
+                    self.logger.log(f"Network error in trading cycle: {e}", "ERROR")
+                    await self._interruptible_sleep(self.config.cycle_wait)
                 except Exception as e:
                     self.logger.log(f"Error in trading cycle: {e}", "ERROR")
                     self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
-                    await asyncio.sleep(self.config.cycle_wait)
+                    await self._interruptible_sleep(self.config.cycle_wait)
 
         except KeyboardInterrupt:
             self.logger.log("Bot stopped by user", "INFO")
@@ -888,14 +1276,46 @@ class CrossExchangeHedgeBot:
         finally:
             # Cleanup
             try:
+                if self._price_task:
+                    self._price_task.cancel()
+                    self._price_task = None
+
                 if self.position.is_open:
                     self.logger.log("Closing open positions before shutdown...", "INFO")
-                    await self._close_hedge_positions()
+                    try:
+                        await asyncio.wait_for(self._close_hedge_positions(), timeout=10)
+                    except asyncio.TimeoutError:
+                        self.logger.log("Timed out closing positions during shutdown", "ERROR")
 
+                # Disconnect both exchanges in parallel, each with a bounded
+                # timeout so a wedged socket can't hang the shutdown
+                disconnects = []
                 if self.paradex_client:
-                    await self.paradex_client.disconnect()
+                    disconnects.append(asyncio.wait_for(self.paradex_client.disconnect(), 5))
                 if self.lighter_client:
-                    await self.lighter_client.disconnect()
+                    disconnects.append(asyncio.wait_for(self.lighter_client.disconnect(), 5))
+                if disconnects:
+                    results = await asyncio.gather(*disconnects, return_exceptions=True)
+                    for result in results:
+                        if isinstance(result, Exception):
+                            self.logger.log(f"Disconnect error during shutdown: {result}", "WARNING")
+
+                # Flush queued notifications (bounded) before closing the
+                # clients they depend on
+                if self._notify_task:
+                    try:
+                        await asyncio.wait_for(self._notify_q.join(), timeout=5)
+                    except asyncio.TimeoutError:
+                        self.logger.log("Timed out flushing notification queue", "WARNING")
+                    self._notify_task.cancel()
+                    self._notify_task = None
+
+                if self._lark_bot:
+                    await self._lark_bot.close()
+                    self._lark_bot = None
+                if self._tg_bot:
+                    self._tg_bot.close()
+                    self._tg_bot = None
 
                 self.logger.log("Cross-exchange hedge bot shutdown complete", "INFO")
             except Exception as e:
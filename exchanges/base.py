@@ -45,6 +45,14 @@ class OrderResult:
     filled_size: Optional[Decimal] = None
 
 
+@dataclass
+class OrderSpec:
+    """Specification for a single order leg in a batched submission."""
+    contract_id: str
+    quantity: Decimal
+    side: str
+
+
 @dataclass
 class OrderInfo:
     """Standardized order information structure."""
@@ -50,7 +50,12 @@ class GrvtClient(BaseExchangeClient):
 
         self._order_update_handler = None
         self._ws_client = None
-        self._order_update_callback = None
+        self._orders_subscribed = False
+
+        # Futures resolved by the WS order stream when an order fills, plus a
+        # small stash for fills whose push beats the placement response
+        self._fill_waiters: Dict[str, asyncio.Future] = {}
+        self._recent_fills: Dict[str, OrderInfo] = {}
 
         # Order size increment (will be set in get_contract_attributes)
         self.order_size_increment = Decimal(0)
@@ -109,10 +114,9 @@ class GrvtClient(BaseExchangeClient):
             await self._ws_client.initialize()
             await asyncio.sleep(2)  # Wait for connection to establish
 
-            # If an order update callback was set before connect, subscribe now
-            if self._order_update_callback is not None:
-                asyncio.create_task(self._subscribe_to_orders(self._order_update_callback))
-                self.logger.log(f"Deferred subscription started for {self.config.contract_id}", "INFO")
+            # Subscribe to the order stream (needs contract_id; if attributes
+            # are fetched after connect, get_contract_attributes retries this)
+            self._ensure_order_subscription()
 
         except Exception as e:
             self.logger.log(f"Error connecting to GRVT WebSocket: {e}", "ERROR")
@@ -133,92 +137,131 @@ class GrvtClient(BaseExchangeClient):
     def setup_order_update_handler(self, handler) -> None:
         """Setup order update handler for WebSocket."""
         self._order_update_handler = handler
+        self._ensure_order_subscription()
 
-        async def order_update_callback(message: Dict[str, Any]):
-            """Handle order updates from WebSocket - match working test implementation."""
-            # Log raw message for debugging
-            self.logger.log(f"Received WebSocket message: {message}", "DEBUG")
-            self.logger.log("**************************************************", "DEBUG")
-            try:
-                # Parse the message structure - match the working test implementation exactly
-                if 'feed' in message:
-                    data = message.get('feed', {})
-                    leg = data.get('legs', [])[0] if data.get('legs') else None
-
-                    if isinstance(data, dict) and leg:
-                        contract_id = leg.get('instrument', '')
-                        if contract_id != self.config.contract_id:
-                            return
-
-                        order_state = data.get('state', {})
-                        # Extract order data using the exact structure from test
-                        order_id = data.get('order_id', '')
-                        status = order_state.get('status', '')
-                        side = 'buy' if leg.get('is_buying_asset') else 'sell'
-                        size = leg.get('size', '0')
-                        price = leg.get('limit_price', '0')
-                        filled_size = order_state.get('traded_size')[0] if order_state.get('traded_size') else '0'
-
-                        if order_id and status:
-                            # Determine order type based on side
-                            if side == self.config.close_order_side:
-                                order_type = "CLOSE"
-                            else:
-                                order_type = "OPEN"
-
-                            # Map GRVT status to our status
-                            status_map = {
-                                'OPEN': 'OPEN',
-                                'FILLED': 'FILLED',
-                                'CANCELLED': 'CANCELED',
-                                'REJECTED': 'CANCELED'
-                            }
-                            mapped_status = status_map.get(status, status)
-
-                            # Handle partially filled orders
-                            if status == 'OPEN' and Decimal(filled_size) > 0:
-                                mapped_status = "PARTIALLY_FILLED"
-
-                            if mapped_status in ['OPEN', 'PARTIALLY_FILLED', 'FILLED', 'CANCELED']:
-                                if self._order_update_handler:
-                                    self._order_update_handler({
-                                        'order_id': order_id,
-                                        'side': side,
-                                        'order_type': order_type,
-                                        'status': mapped_status,
-                                        'size': size,
-                                        'price': price,
-                                        'contract_id': contract_id,
-                                        'filled_size': filled_size
-                                    })
+    def _ensure_order_subscription(self) -> None:
+        """Subscribe to the order stream once the WS client and contract are ready."""
+        if self._orders_subscribed or not self._ws_client or not self.config.contract_id:
+            return
+        self._orders_subscribed = True
+        try:
+            asyncio.create_task(self._subscribe_to_orders(self._ws_order_dispatch))
+            self.logger.log(f"Initiated order-update subscription for {self.config.contract_id}", "INFO")
+        except Exception as e:
+            self._orders_subscribed = False
+            self.logger.log(f"Error subscribing to order updates: {e}", "ERROR")
+
+    async def wait_for_fill(self, order_id: str, timeout: float) -> Optional[OrderInfo]:
+        """Wait for the WS order stream to report a fill for the given order.
+
+        Returns the fill's OrderInfo, or None if the timeout expires (callers
+        should fall back to a REST get_order_info check).
+        """
+        # The push may have arrived before the placement response returned
+        stashed = self._recent_fills.pop(order_id, None)
+        if stashed is not None:
+            return stashed
+
+        fut = asyncio.get_running_loop().create_future()
+        self._fill_waiters[order_id] = fut
+        try:
+            return await asyncio.wait_for(fut, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._fill_waiters.pop(order_id, None)
+
+    async def _ws_order_dispatch(self, message: Dict[str, Any]):
+        """Handle order updates from WebSocket - match working test implementation."""
+        # Log raw message for debugging
+        self.logger.log(f"Received WebSocket message: {message}", "DEBUG")
+        self.logger.log("**************************************************", "DEBUG")
+        try:
+            # Parse the message structure - match the working test implementation exactly
+            if 'feed' in message:
+                data = message.get('feed', {})
+                leg = data.get('legs', [])[0] if data.get('legs') else None
+
+                if isinstance(data, dict) and leg:
+                    contract_id = leg.get('instrument', '')
+                    if contract_id != self.config.contract_id:
+                        return
+
+                    order_state = data.get('state', {})
+                    # Extract order data using the exact structure from test
+                    order_id = data.get('order_id', '')
+                    status = order_state.get('status', '')
+                    side = 'buy' if leg.get('is_buying_asset') else 'sell'
+                    size = leg.get('size', '0')
+                    price = leg.get('limit_price', '0')
+                    filled_size = order_state.get('traded_size')[0] if order_state.get('traded_size') else '0'
+
+                    if order_id and status:
+                        # Determine order type based on side
+                        if side == self.config.close_order_side:
+                            order_type = "CLOSE"
+                        else:
+                            order_type = "OPEN"
+
+                        # Map GRVT status to our status
+                        status_map = {
+                            'OPEN': 'OPEN',
+                            'FILLED': 'FILLED',
+                            'CANCELLED': 'CANCELED',
+                            'REJECTED': 'CANCELED'
+                        }
+                        mapped_status = status_map.get(status, status)
+
+                        # Handle partially filled orders
+                        if status == 'OPEN' and Decimal(filled_size) > 0:
+                            mapped_status = "PARTIALLY_FILLED"
+
+                        # Resolve any fill waiter parked on this order
+                        if mapped_status == 'FILLED':
+                            fill_info = OrderInfo(
+                                order_id=order_id,
+                                side=side,
+                                size=Decimal(size),
+                                price=Decimal(price),
+                                status='FILLED',
+                                filled_size=Decimal(filled_size),
+                                remaining_size=Decimal(0)
+                            )
+                            waiter = self._fill_waiters.get(order_id)
+                            if waiter is not None and not waiter.done():
+                                waiter.set_result(fill_info)
                             else:
-                                self.logger.log(f"Ignoring order update with status: {mapped_status}", "DEBUG")
+                                # Push beat the placement response; stash it
+                                self._recent_fills[order_id] = fill_info
+                                while len(self._recent_fills) > 32:
+                                    self._recent_fills.pop(next(iter(self._recent_fills)))
+
+                        if mapped_status in ['OPEN', 'PARTIALLY_FILLED', 'FILLED', 'CANCELED']:
+                            if self._order_update_handler:
+                                self._order_update_handler({
+                                    'order_id': order_id,
+                                    'side': side,
+                                    'order_type': order_type,
+                                    'status': mapped_status,
+                                    'size': size,
+                                    'price': price,
+                                    'contract_id': contract_id,
+                                    'filled_size': filled_size
+                                })
                         else:
-                            self.logger.log(f"Order update missing order_id or status: {data}", "DEBUG")
+                            self.logger.log(f"Ignoring order update with status: {mapped_status}", "DEBUG")
                     else:
-                        self.logger.log(f"Order update data is not dict or missing legs: {data}", "DEBUG")
+                        self.logger.log(f"Order update missing order_id or status: {data}", "DEBUG")
                 else:
-                    # Handle other message types (position, fill, etc.)
-                    method = message.get('method', 'unknown')
-                    self.logger.log(f"Received non-order message: {method}", "DEBUG")
-
-            except Exception as e:
-                self.logger.log(f"Error handling order update: {e}", "ERROR")
-                self.logger.log(f"Message that caused error: {message}", "ERROR")
-
-        # Store callback for use after connect
-        self._order_update_callback = order_update_callback
+                    self.logger.log(f"Order update data is not dict or missing legs: {data}", "DEBUG")
+            else:
+                # Handle other message types (position, fill, etc.)
+                method = message.get('method', 'unknown')
+                self.logger.log(f"Received non-order message: {method}", "DEBUG")
 
-        # Subscribe immediately if WebSocket is already initialized; otherwise defer to connect()
-        if self._ws_client:
-            try:
-                asyncio.create_task(self._subscribe_to_orders(self._order_update_callback))
-                self.logger.log(f"Successfully initiated subscription to order updates for {self.config.contract_id}", "INFO")
-            except Exception as e:
-                self.logger.log(f"Error subscribing to order updates: {e}", "ERROR")
-                raise
-        else:
-            self.logger.log("WebSocket not ready yet; will subscribe after connect()", "INFO")
+        except Exception as e:
+            self.logger.log(f"Error handling order update: {e}", "ERROR")
+            self.logger.log(f"Message that caused error: {message}", "ERROR")
 
     async def _subscribe_to_orders(self, callback):
         """Subscribe to order updates asynchronously."""
@@ -667,6 +710,10 @@ class GrvtClient(BaseExchangeClient):
                         f"Order quantity is less than min quantity: {self.config.quantity} < {min_size}"
                     )
 
+                # The order-stream subscription needs the contract id; pick it
+                # up now if connect() ran before attributes were known
+                self._ensure_order_subscription()
+
                 return self.config.contract_id, self.config.tick_size
 
         raise ValueError(f"Contract not found for ticker: {ticker}")
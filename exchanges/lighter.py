@@ -9,7 +9,8 @@ import logging
 from decimal import Decimal
 from typing import Dict, Any, List, Optional, Tuple
 
-from .base import BaseExchangeClient, OrderResult, OrderInfo, query_retry
+from .base import BaseExchangeClient, OrderResult, OrderInfo, OrderSpec, query_retry
+from helpers import contract_cache
 from helpers.logger import TradingLogger
 
 # Import official Lighter SDK for API client
@@ -30,28 +31,71 @@ if root_logger.level == logging.DEBUG:
 class LighterClient(BaseExchangeClient):
     """Lighter exchange client implementation."""
 
-    def __init__(self, config: Dict[str, Any]):
-        """Initialize Lighter client."""
-        super().__init__(config)
+    def __init__(self, config: Dict[str, Any], api_client: Optional[ApiClient] = None,
+                 api_key_private_key: Optional[str] = None,
+                 account_index: Optional[int] = None,
+                 api_key_index: Optional[int] = None):
+        """Initialize Lighter client.
 
-        # Lighter credentials from environment
-        self.api_key_private_key = os.getenv('API_KEY_PRIVATE_KEY')
-        self.account_index = int(os.getenv('LIGHTER_ACCOUNT_INDEX', '0'))
-        self.api_key_index = int(os.getenv('LIGHTER_API_KEY_INDEX', '0'))
+        Args:
+            config: Client configuration object
+            api_client: Optional shared ApiClient. When several clients run in
+                one process (e.g. dual-account hedging) injecting one lets
+                them ride a single HTTP connection pool; the caller keeps
+                ownership and is responsible for closing it.
+            api_key_private_key: Optional explicit API key; falls back to the
+                API_KEY_PRIVATE_KEY environment variable.
+            account_index: Optional explicit account index; falls back to
+                LIGHTER_ACCOUNT_INDEX.
+            api_key_index: Optional explicit API key index; falls back to
+                LIGHTER_API_KEY_INDEX.
+
+        Explicit credentials let several accounts coexist in one process
+        without mutating os.environ between client constructions.
+        """
+        # Resolve credentials before _validate_config runs in the base ctor.
+        # Any field not injected explicitly must come from the environment;
+        # _validate_config checks those vars so a forgotten LIGHTER_ACCOUNT_INDEX
+        # fails loudly instead of silently trading against account 0.
+        self._env_credential_vars = []
+        if api_key_private_key is None:
+            self._env_credential_vars.append('API_KEY_PRIVATE_KEY')
+        if account_index is None:
+            self._env_credential_vars.append('LIGHTER_ACCOUNT_INDEX')
+        if api_key_index is None:
+            self._env_credential_vars.append('LIGHTER_API_KEY_INDEX')
+        self.api_key_private_key = (api_key_private_key if api_key_private_key is not None
+                                    else os.getenv('API_KEY_PRIVATE_KEY'))
+        self.account_index = int(account_index if account_index is not None
+                                 else os.getenv('LIGHTER_ACCOUNT_INDEX', '0'))
+        self.api_key_index = int(api_key_index if api_key_index is not None
+                                 else os.getenv('LIGHTER_API_KEY_INDEX', '0'))
         self.base_url = "https://mainnet.zklighter.elliot.ai"
 
-        if not self.api_key_private_key:
-            raise ValueError("API_KEY_PRIVATE_KEY must be set in environment variables")
+        super().__init__(config)
 
         # Initialize logger
         self.logger = TradingLogger(exchange="lighter", ticker=self.config.ticker, log_to_console=False)
         self._order_update_handler = None
 
+        # Duration of the most recent order submission (set in
+        # _submit_order_with_retry); None until the first order goes out
+        self.last_submit_latency = None
+
         # Initialize Lighter client (will be done in connect)
         self.lighter_client = None
 
-        # Initialize API client (will be done in connect)
+        # Initialize API client (will be done in connect unless injected)
         self.api_client = None
+        self._injected_api_client = api_client
+        self._owns_api_client = api_client is None
+
+        # Shared API helper instances, created once per ApiClient so every
+        # request reuses the same underlying HTTP session/connection pool
+        self._order_api = None
+        self._order_api_client = None
+        self._account_api = None
+        self._account_api_client = None
 
         # Market configuration
         self.base_amount_multiplier = None
@@ -62,16 +106,32 @@ class LighterClient(BaseExchangeClient):
 
     def _validate_config(self) -> None:
         """Validate Lighter configuration."""
-        required_env_vars = ['API_KEY_PRIVATE_KEY', 'LIGHTER_ACCOUNT_INDEX', 'LIGHTER_API_KEY_INDEX']
-        missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+        missing_vars = [var for var in self._env_credential_vars if not os.getenv(var)]
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {missing_vars}")
+        if not self.api_key_private_key:
+            raise ValueError("API_KEY_PRIVATE_KEY must be provided explicitly "
+                             "or set in environment variables")
+
+    def get_order_api(self) -> 'lighter.OrderApi':
+        """Return the shared OrderApi bound to the current ApiClient."""
+        if self._order_api is None or self._order_api_client is not self.api_client:
+            self._order_api = lighter.OrderApi(self.api_client)
+            self._order_api_client = self.api_client
+        return self._order_api
+
+    def get_account_api(self) -> 'lighter.AccountApi':
+        """Return the shared AccountApi bound to the current ApiClient."""
+        if self._account_api is None or self._account_api_client is not self.api_client:
+            self._account_api = lighter.AccountApi(self.api_client)
+            self._account_api_client = self.api_client
+        return self._account_api
 
     async def _get_market_config(self, ticker: str) -> Tuple[int, int, int]:
         """Get market configuration for a ticker using official SDK."""
         try:
             # Use shared API client
-            order_api = lighter.OrderApi(self.api_client)
+            order_api = self.get_order_api()
 
             # Get order books to find market info
             order_books = await order_api.order_books()
@@ -123,8 +183,11 @@ class LighterClient(BaseExchangeClient):
     async def connect(self) -> None:
         """Connect to Lighter."""
         try:
-            # Initialize shared API client
-            self.api_client = ApiClient(configuration=Configuration(host=self.base_url))
+            # Initialize shared API client (adopt an injected one if provided)
+            if self._injected_api_client is not None:
+                self.api_client = self._injected_api_client
+            else:
+                self.api_client = ApiClient(configuration=Configuration(host=self.base_url))
 
             # Initialize Lighter client
             await self._initialize_lighter_client()
@@ -158,13 +221,27 @@ class LighterClient(BaseExchangeClient):
             if hasattr(self, 'ws_manager') and self.ws_manager:
                 await self.ws_manager.disconnect()
 
-            # Close shared API client
+            # Close shared API client (injected clients are owned by the caller)
             if self.api_client:
-                await self.api_client.close()
+                if self._owns_api_client:
+                    await self.api_client.close()
                 self.api_client = None
         except Exception as e:
             self.logger.log(f"Error during Lighter disconnect: {e}", "ERROR")
 
+    async def warmup(self) -> None:
+        """Pre-warm the HTTP connection used for order submission.
+
+        Lighter orders are signed transactions sent over HTTPS. Issuing a
+        cheap account query right after connect() pays the TCP+TLS handshake
+        cost up front instead of on the first live order.
+        """
+        try:
+            await self.get_account_api().account(by="index", value=str(self.account_index))
+            self.logger.log("Order submission path pre-warmed", "INFO")
+        except Exception as e:
+            self.logger.log(f"Warmup request failed (non-fatal): {e}", "WARNING")
+
     def get_exchange_name(self) -> str:
         """Get the exchange name."""
         return "lighter"
@@ -231,14 +308,30 @@ class LighterClient(BaseExchangeClient):
             if status in ['FILLED', 'CANCELED']:
                 self.logger.log_transaction(order_id, side, filled_size, price, status)
 
+    @property
+    def price_tick_event(self) -> Optional[asyncio.Event]:
+        """Event set by the WebSocket handler on each BBO update, or None."""
+        ws_manager = getattr(self, 'ws_manager', None)
+        return ws_manager.price_tick_event if ws_manager else None
+
+    def get_cached_bbo(self) -> Optional[Tuple[Decimal, Decimal, float]]:
+        """Return the latest streamed BBO as (bid, ask, timestamp), or None."""
+        ws_manager = getattr(self, 'ws_manager', None)
+        if ws_manager and ws_manager.best_bid_dec and ws_manager.best_ask_dec:
+            return (ws_manager.best_bid_dec,
+                    ws_manager.best_ask_dec,
+                    ws_manager.last_bbo_update_ts or 0.0)
+        return None
+
     @query_retry(default_return=(0, 0))
     async def fetch_bbo_prices(self, contract_id: str) -> Tuple[Decimal, Decimal]:
         """Get orderbook using official SDK."""
         # Use WebSocket data if available
         if (hasattr(self, 'ws_manager') and
-                self.ws_manager.best_bid and self.ws_manager.best_ask):
-            best_bid = Decimal(str(self.ws_manager.best_bid))
-            best_ask = Decimal(str(self.ws_manager.best_ask))
+                self.ws_manager.best_bid_dec and self.ws_manager.best_ask_dec):
+            # Decimal conversion happens once per update in the WS handler
+            best_bid = self.ws_manager.best_bid_dec
+            best_ask = self.ws_manager.best_ask_dec
 
             if best_bid <= 0 or best_ask <= 0 or best_bid >= best_ask:
                 self.logger.log("Invalid bid/ask prices", "ERROR")
@@ -257,8 +350,11 @@ class LighterClient(BaseExchangeClient):
             # For now, raise an error if client is not initialized
             raise ValueError("Lighter client not initialized. Call connect() first.")
 
-        # Create order using official SDK
+        # Create order using official SDK; record submission-only latency
+        # (excludes any fill wait) for callers that synchronize legs
+        submit_start = time.monotonic()
         create_order, tx_hash, error = await self.lighter_client.create_order(**order_params)
+        self.last_submit_latency = time.monotonic() - submit_start
         if error is not None:
             return OrderResult(
                 success=False, order_id=str(order_params['client_order_index']),
@@ -363,7 +459,8 @@ class LighterClient(BaseExchangeClient):
             raise Exception(f"[CLOSE] Error placing order: {order_result.error_message}")
 
     async def place_market_order(self, contract_id: str, quantity: Decimal, side: str,
-                                  aggressive_offset: Decimal = Decimal('0.002')) -> OrderResult:
+                                  aggressive_offset: Decimal = Decimal('0.002'),
+                                  bbo: Optional[Tuple[Decimal, Decimal]] = None) -> OrderResult:
         """Place a market order using aggressive limit order pricing.
 
         Args:
@@ -371,12 +468,17 @@ class LighterClient(BaseExchangeClient):
             quantity: Order quantity
             side: 'buy' or 'sell'
             aggressive_offset: Price offset percentage to ensure immediate fill (default 0.2%)
+            bbo: Optional (best_bid, best_ask) snapshot prefetched by the
+                caller; skips the internal BBO lookup when provided
 
         Returns:
             OrderResult with order details
         """
-        # Get current market prices
-        best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
+        # Get current market prices (unless the caller already has them)
+        if bbo is not None:
+            best_bid, best_ask = bbo
+        else:
+            best_bid, best_ask = await self.fetch_bbo_prices(contract_id)
 
         if best_bid <= 0 or best_ask <= 0 or best_bid >= best_ask:
             raise ValueError("Invalid bid/ask prices")
@@ -434,7 +536,25 @@ class LighterClient(BaseExchangeClient):
             status=order_status,
             filled_size=self.current_order.filled_size if self.current_order else Decimal(0)
         )
-    
+
+    async def place_market_orders_batch(self, orders: List[OrderSpec]) -> List[OrderResult]:
+        """Place multiple market orders in a single submission round.
+
+        Lighter has no native batch endpoint, so the legs are submitted
+        concurrently over the shared signer client to collapse the per-order
+        round-trips into one execution window.
+
+        Args:
+            orders: List of OrderSpec describing each leg
+
+        Returns:
+            List of OrderResult (or Exception) in the same order as the specs
+        """
+        return await asyncio.gather(
+            *(self.place_market_order(spec.contract_id, spec.quantity, spec.side) for spec in orders),
+            return_exceptions=True
+        )
+
     async def get_order_price(self, side: str = '') -> Decimal:
         """Get the price of an order with Lighter using official SDK."""
         # Get current market prices
@@ -470,7 +590,7 @@ class LighterClient(BaseExchangeClient):
         """Get order information from Lighter using official SDK."""
         try:
             # Use shared API client to get account info
-            account_api = lighter.AccountApi(self.api_client)
+            account_api = self.get_account_api()
 
             # Get account orders
             account_data = await account_api.account(by="index", value=str(self.account_index))
@@ -510,7 +630,7 @@ class LighterClient(BaseExchangeClient):
             raise ValueError(f"Error creating auth token: {error}")
 
         # Use OrderApi to get active orders
-        order_api = lighter.OrderApi(self.api_client)
+        order_api = self.get_order_api()
 
         # Get active orders for the specific market
         orders_response = await order_api.account_active_orders(
@@ -555,7 +675,7 @@ class LighterClient(BaseExchangeClient):
     async def _fetch_positions_with_retry(self) -> List[Dict[str, Any]]:
         """Get positions using official SDK."""
         # Use shared API client
-        account_api = lighter.AccountApi(self.api_client)
+        account_api = self.get_account_api()
 
         # Get account info
         account_data = await account_api.account(by="index", value=str(self.account_index))
@@ -586,7 +706,7 @@ class LighterClient(BaseExchangeClient):
         """
         try:
             # Use official SDK to get account balance
-            account_api = lighter.AccountApi(self.api_client)
+            account_api = self.get_account_api()
 
             # Call with correct parameters: by="index", value=str(account_index)
             account_data = await account_api.account(by="index", value=str(self.account_index))
@@ -621,7 +741,17 @@ class LighterClient(BaseExchangeClient):
             self.logger.log("Ticker is empty", "ERROR")
             raise ValueError("Ticker is empty")
 
-        order_api = lighter.OrderApi(self.api_client)
+        # Contract metadata changes rarely; reuse a recent cached answer
+        # instead of paying two metadata round-trips on every start
+        cached = contract_cache.get('lighter', ticker)
+        if cached:
+            self.config.contract_id = cached['contract_id']
+            self.base_amount_multiplier = cached['base_amount_multiplier']
+            self.price_multiplier = cached['price_multiplier']
+            self.config.tick_size = Decimal(cached['tick_size'])
+            return self.config.contract_id, self.config.tick_size
+
+        order_api = self.get_order_api()
         # Get all order books to find the market for our ticker
         order_books = await order_api.order_books()
 
@@ -649,4 +779,11 @@ class LighterClient(BaseExchangeClient):
             self.logger.log("Failed to get tick size", "ERROR")
             raise ValueError("Failed to get tick size")
 
+        contract_cache.put('lighter', ticker, {
+            'contract_id': self.config.contract_id,
+            'tick_size': str(self.config.tick_size),
+            'base_amount_multiplier': self.base_amount_multiplier,
+            'price_multiplier': self.price_multiplier,
+        })
+
         return self.config.contract_id, self.config.tick_size
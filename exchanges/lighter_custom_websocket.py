@@ -6,9 +6,26 @@ Based on the sample code provided by the user.
 import asyncio
 import json
 import time
+from decimal import Decimal
 from typing import Dict, Any, List, Optional, Tuple, Callable
 import websockets
 
+# Prefer a fast JSON parser for frame decoding when available; order book
+# bursts arrive faster than the stdlib parser can comfortably drain them
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+    except ImportError:
+        _json_loads = json.loads
+
+# Pre-serialized heartbeat reply - sent on every server ping, so avoid
+# re-encoding it each time
+PONG_FRAME = json.dumps({"type": "pong"})
+
 
 class LighterCustomWebSocketManager:
     """Custom WebSocket manager for Lighter order updates and order book without SDK."""
@@ -24,6 +41,13 @@ class LighterCustomWebSocketManager:
         self.order_book = {"bids": {}, "asks": {}}
         self.best_bid = None
         self.best_ask = None
+        # Decimal copies converted once per update, so consumers don't pay a
+        # Decimal(str(...)) parse on every read
+        self.best_bid_dec = None
+        self.best_ask_dec = None
+        self.last_bbo_update_ts = None
+        # Set on every BBO update so consumers can wake on new ticks instead of polling
+        self.price_tick_event = asyncio.Event()
         self.snapshot_loaded = False
         self.order_book_offset = None
         self.order_book_sequence_gap = False
@@ -225,6 +249,9 @@ class LighterCustomWebSocketManager:
             self.snapshot_loaded = False
             self.best_bid = None
             self.best_ask = None
+            self.best_bid_dec = None
+            self.best_ask_dec = None
+            self.last_bbo_update_ts = None
             self.order_book_offset = None
             self.order_book_sequence_gap = False
 
@@ -250,7 +277,10 @@ class LighterCustomWebSocketManager:
                 # Reset order book state before connecting
                 await self.reset_order_book()
 
-                async with websockets.connect(self.ws_url) as self.ws:
+                # Disable per-message deflate: order book frames are small and
+                # frequent, so the compression CPU cost outweighs the bandwidth
+                # saving and adds latency to every tick
+                async with websockets.connect(self.ws_url, compression=None) as self.ws:
                     # Subscribe to order book updates
                     await self.ws.send(json.dumps({
                         "type": "subscribe",
@@ -290,8 +320,8 @@ class LighterCustomWebSocketManager:
                             msg = await asyncio.wait_for(self.ws.recv(), timeout=1)
 
                             try:
-                                data = json.loads(msg)
-                            except json.JSONDecodeError as e:
+                                data = _json_loads(msg)
+                            except ValueError as e:
                                 self._log(f"JSON parsing error in Lighter websocket: {e}", "ERROR")
                                 continue
 
@@ -360,12 +390,17 @@ class LighterCustomWebSocketManager:
                                     # Update global variables
                                     if best_bid_price is not None:
                                         self.best_bid = best_bid_price
+                                        self.best_bid_dec = Decimal(str(best_bid_price))
                                     if best_ask_price is not None:
                                         self.best_ask = best_ask_price
+                                        self.best_ask_dec = Decimal(str(best_ask_price))
+                                    if best_bid_price is not None or best_ask_price is not None:
+                                        self.last_bbo_update_ts = time.time()
+                                        self.price_tick_event.set()
 
                                 elif data.get("type") == "ping":
                                     # Respond to ping with pong
-                                    await self.ws.send(json.dumps({"type": "pong"}))
+                                    await self.ws.send(PONG_FRAME)
                                 elif data.get("type") == "update/account_orders":
                                     # Handle account orders updates
                                     orders = data.get("orders", {}).get(str(self.market_index), [])
@@ -9,7 +9,8 @@ from decimal import Decimal, ROUND_HALF_UP
 from typing import Dict, Any, List, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_fixed, retry_if_exception_type
 
-from .base import BaseExchangeClient, OrderResult, OrderInfo
+from .base import BaseExchangeClient, OrderResult, OrderInfo, OrderSpec
+from helpers import contract_cache
 from helpers.logger import TradingLogger
 
 
@@ -105,8 +106,22 @@ class ParadexClient(BaseExchangeClient):
         self._initialize_paradex_client()
 
         self._order_update_handler = None
+
+        # Duration of the most recent order submission (set in
+        # _submit_order_with_retry); None until the first order goes out
+        self.last_submit_latency = None
+        # Futures keyed by order_id, resolved when the ORDERS channel pushes
+        # a terminal fill - lets callers await fills instead of polling REST
+        self._fill_waiters: Dict[str, asyncio.Future] = {}
+        # Fills that arrived before anyone was waiting (the push can beat the
+        # REST placement response); consumed by the next wait_for_fill call
+        self._recent_fills: Dict[str, OrderInfo] = {}
         self.order_size_increment = ''
         self.min_notional = Decimal(0)  # Will be set during get_contract_attributes()
+        self._bbo_cache = None  # (bid, ask, timestamp) from the BBO WebSocket channel
+        self._bbo_subscribed = False
+        # Set on every BBO update so consumers can wake on new ticks instead of polling
+        self.price_tick_event = asyncio.Event()
 
     def _initialize_paradex_client(self) -> None:
         """Initialize the Paradex client with L2 credentials only."""
@@ -162,6 +177,41 @@ class ParadexClient(BaseExchangeClient):
         except Exception as e:
             self.logger.log(f"Error during Paradex disconnect: {e}", "ERROR")
 
+    async def warmup(self) -> None:
+        """Pre-warm the HTTP connection used for order submission.
+
+        The Paradex SDK has no WebSocket trading channel, so orders go over
+        HTTPS. Issuing a cheap authenticated request right after connect()
+        pays the TCP+TLS handshake cost up front instead of on the first
+        live order.
+        """
+        self._tune_http_pool()
+        try:
+            self.paradex.api_client.fetch_account_summary()
+            self.logger.log("Order submission path pre-warmed", "INFO")
+        except Exception as e:
+            self.logger.log(f"Warmup request failed (non-fatal): {e}", "WARNING")
+
+    def _tune_http_pool(self) -> None:
+        """Enlarge the SDK's requests.Session connection pool when exposed.
+
+        The SDK keeps one requests.Session for all REST calls; the default
+        adapter holds only 10 pooled connections, so bursts (place +
+        get_order_info + cancel across retries) can recycle sockets and pay
+        fresh TLS handshakes. Guarded by duck-typing since this reaches into
+        SDK internals.
+        """
+        try:
+            import requests.adapters
+            session = getattr(getattr(self.paradex.api_client, 'client', None), 'session', None)
+            if session is None or not hasattr(session, 'mount'):
+                return
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            session.mount('https://', adapter)
+            self.logger.log("HTTP connection pool enlarged (maxsize=32)", "DEBUG")
+        except Exception as e:
+            self.logger.log(f"HTTP pool tuning skipped: {e}", "DEBUG")
+
     def get_exchange_name(self) -> str:
         """Get the exchange name."""
         return "paradex"
@@ -170,66 +220,102 @@ class ParadexClient(BaseExchangeClient):
         """Setup order update handler for WebSocket."""
         self._order_update_handler = handler
 
-        async def order_update_handler(ws_channel, message):
-            """Handle order updates from WebSocket."""
-            from paradex_py.api.ws_client import ParadexWebsocketChannel
-
-            params = message.get("params", {})
-            data = params.get("data", {})
-
-            if ws_channel == ParadexWebsocketChannel.ORDERS:
-                # Extract order data
-                order_id = data.get("id")
-                status = data.get("status")
-                side = data.get("side", "").lower()
-                remaining_size = data.get("remaining_size")
-                size = data.get("size")
-                price = data.get("price")
-                contract_id = data.get("market")
-                filled_size = str(Decimal(size) - Decimal(remaining_size))
-                if contract_id != self.config.contract_id:
-                    return
-
-                if order_id and status:
-                    # Determine order type based on side
-                    if side == self.config.close_order_side:
-                        order_type = "CLOSE"
+    async def _ws_order_dispatch(self, ws_channel, message):
+        """Handle order updates from WebSocket."""
+        from paradex_py.api.ws_client import ParadexWebsocketChannel
+
+        params = message.get("params", {})
+        data = params.get("data", {})
+
+        if ws_channel == ParadexWebsocketChannel.ORDERS:
+            # Extract order data
+            order_id = data.get("id")
+            status = data.get("status")
+            side = data.get("side", "").lower()
+            remaining_size = data.get("remaining_size")
+            size = data.get("size")
+            price = data.get("price")
+            contract_id = data.get("market")
+            filled_size = str(Decimal(size) - Decimal(remaining_size))
+            if contract_id != self.config.contract_id:
+                return
+
+            if order_id and status:
+                # Determine order type based on side
+                if side == self.config.close_order_side:
+                    order_type = "CLOSE"
+                else:
+                    order_type = "OPEN"
+
+                # Map Paradex status to our status
+                status_map = {
+                    'NEW': 'OPEN',
+                    'OPEN': 'OPEN',
+                    'CLOSED': 'CANCELED' if data.get("cancel_reason") else 'FILLED'
+                }
+                mapped_status = status_map.get(status, status)
+
+                # Handle partially filled orders
+                if status == 'OPEN' and Decimal(filled_size) > 0:
+                    mapped_status = "PARTIALLY_FILLED"
+
+                # Resolve any fill waiter parked on this order; if none is
+                # registered yet, stash the fill for the next wait_for_fill
+                if mapped_status == 'FILLED':
+                    fill_info = OrderInfo(
+                        order_id=order_id,
+                        side=side,
+                        size=Decimal(size),
+                        price=Decimal(price),
+                        status='CLOSED',
+                        filled_size=Decimal(filled_size),
+                        remaining_size=Decimal(remaining_size)
+                    )
+                    waiter = self._fill_waiters.get(order_id)
+                    if waiter and not waiter.done():
+                        waiter.set_result(fill_info)
                     else:
-                        order_type = "OPEN"
-
-                    # Map Paradex status to our status
-                    status_map = {
-                        'NEW': 'OPEN',
-                        'OPEN': 'OPEN',
-                        'CLOSED': 'CANCELED' if data.get("cancel_reason") else 'FILLED'
-                    }
-                    mapped_status = status_map.get(status, status)
-
-                    # Handle partially filled orders
-                    if status == 'OPEN' and Decimal(filled_size) > 0:
-                        mapped_status = "PARTIALLY_FILLED"
-
-                    if mapped_status in ['OPEN', 'PARTIALLY_FILLED', 'FILLED', 'CANCELED']:
-                        if self._order_update_handler:
-                            self._order_update_handler({
-                                'order_id': order_id,
-                                'side': side,
-                                'order_type': order_type,
-                                'status': mapped_status,
-                                'size': size,
-                                'price': price,
-                                'contract_id': contract_id,
-                                'filled_size': filled_size
-                            })
-
-        # Store the handler for later use
-        self._ws_order_update_handler = order_update_handler
+                        self._recent_fills[order_id] = fill_info
+                        # Keep the stash bounded; stale entries are useless
+                        while len(self._recent_fills) > 32:
+                            self._recent_fills.pop(next(iter(self._recent_fills)))
+
+                if mapped_status in ['OPEN', 'PARTIALLY_FILLED', 'FILLED', 'CANCELED']:
+                    if self._order_update_handler:
+                        self._order_update_handler({
+                            'order_id': order_id,
+                            'side': side,
+                            'order_type': order_type,
+                            'status': mapped_status,
+                            'size': size,
+                            'price': price,
+                            'contract_id': contract_id,
+                            'filled_size': filled_size
+                        })
+
+    async def wait_for_fill(self, order_id: str, timeout: float) -> Optional[OrderInfo]:
+        """Wait for the ORDERS channel to push a fill for order_id.
+
+        Returns the filled OrderInfo, or None on timeout - callers should
+        confirm via get_order_info before treating None as "not filled",
+        since the push can be missed if the WebSocket drops.
+        """
+        # The push may have arrived before the placement response did
+        early_fill = self._recent_fills.pop(order_id, None)
+        if early_fill is not None:
+            return early_fill
 
-    async def _setup_websocket_subscription(self) -> None:
-        """Setup WebSocket subscription for order updates."""
-        if not hasattr(self, '_ws_order_update_handler'):
-            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._fill_waiters[order_id] = waiter
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._fill_waiters.pop(order_id, None)
 
+    async def _setup_websocket_subscription(self) -> None:
+        """Setup WebSocket subscriptions for order updates and BBO prices."""
         # Ensure WebSocket is connected
         if not hasattr(self, '_ws_connected') or not self._ws_connected:
             is_connected = False
@@ -241,20 +327,59 @@ class ParadexClient(BaseExchangeClient):
             self._ws_connected = True
             self.logger.log("WebSocket connected for order monitoring", "INFO")
 
-        # Subscribe to orders channel for the specific market
         from paradex_py.api.ws_client import ParadexWebsocketChannel
 
         contract_id = self.config.contract_id
+
+        # Subscribe to BBO channel so prices are streamed into the local cache
+        await self._subscribe_bbo()
+
+        # Subscribe to the orders channel unconditionally: fill waiters rely
+        # on the push stream even when no external handler is registered
         try:
             await self.paradex.ws_client.subscribe(
                 ParadexWebsocketChannel.ORDERS,
-                callback=self._ws_order_update_handler,
+                callback=self._ws_order_dispatch,
                 params={"market": contract_id}
             )
             self.logger.log(f"Subscribed to order updates for {contract_id}", "INFO")
         except Exception as e:
             self.logger.log(f"Failed to subscribe to order updates: {e}", "ERROR")
 
+    async def _subscribe_bbo(self) -> None:
+        """Subscribe to the BBO channel once the market is known."""
+        if self._bbo_subscribed or not self.config.contract_id:
+            return
+        if not getattr(self, '_ws_connected', False):
+            return
+
+        from paradex_py.api.ws_client import ParadexWebsocketChannel
+
+        contract_id = self.config.contract_id
+
+        async def bbo_handler(ws_channel, message):
+            data = message.get("params", {}).get("data", {})
+            bid = data.get("bid")
+            ask = data.get("ask")
+            if bid and ask:
+                self._bbo_cache = (Decimal(bid), Decimal(ask), time.time())
+                self.price_tick_event.set()
+
+        try:
+            await self.paradex.ws_client.subscribe(
+                ParadexWebsocketChannel.BBO,
+                callback=bbo_handler,
+                params={"market": contract_id}
+            )
+            self._bbo_subscribed = True
+            self.logger.log(f"Subscribed to BBO updates for {contract_id}", "INFO")
+        except Exception as e:
+            self.logger.log(f"Failed to subscribe to BBO updates: {e}", "ERROR")
+
+    def get_cached_bbo(self) -> Optional[Tuple[Decimal, Decimal, float]]:
+        """Return the latest streamed BBO as (bid, ask, timestamp), or None."""
+        return self._bbo_cache
+
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_fixed(3),
@@ -263,6 +388,12 @@ class ParadexClient(BaseExchangeClient):
     )
     async def fetch_bbo_prices(self, contract_id: str) -> Dict[str, Any]:
         """Get orderbook using official SDK."""
+        # Serve straight from the streamed BBO when it is fresh enough that a
+        # REST round-trip could not return anything newer
+        cached = self._bbo_cache
+        if cached is not None and time.time() - cached[2] < 0.05:
+            return cached[0], cached[1]
+
         orderbook_data = self.paradex.api_client.fetch_orderbook(contract_id, {"depth": 1})
         if not orderbook_data:
             self.logger.log("Failed to get orderbook", "ERROR")
@@ -315,8 +446,11 @@ class ParadexClient(BaseExchangeClient):
     )
     def _submit_order_with_retry(self, order) -> OrderResult:
         """Submit an order with Paradex using official SDK."""
-        # Submit order using official SDK
+        # Submit order using official SDK; record submission-only latency
+        # (excludes any fill wait) for callers that synchronize legs
+        submit_start = time.monotonic()
         order_result = self.paradex.api_client.submit_order(order)
+        self.last_submit_latency = time.monotonic() - submit_start
 
         # Extract order ID from response
         order_id = order_result.get('id')
@@ -571,18 +705,14 @@ class ParadexClient(BaseExchangeClient):
                 error_message='No order ID in response'
             )
 
-        # Wait for order to fill or timeout
-        import time
-        start_time = time.time()
+        # Wait for the WS-pushed fill; one REST lookup on timeout covers a
+        # missed push before giving up
         timeout = 10
-
-        while time.time() - start_time < timeout:
+        order_info = await self.wait_for_fill(order_id, timeout=timeout)
+        if order_info is None:
             order_info = await self.get_order_info(order_id)
 
-            if order_info is None:
-                await asyncio.sleep(0.5)
-                continue
-
+        if order_info is not None:
             if order_info.status == 'CLOSED' and order_info.filled_size > 0:
                 # Order filled
                 return OrderResult(
@@ -594,10 +724,7 @@ class ParadexClient(BaseExchangeClient):
                     status='FILLED',
                     filled_size=order_info.filled_size
                 )
-            elif order_info.status == 'OPEN':
-                # Still open, wait a bit
-                await asyncio.sleep(0.2)
-            else:
+            elif order_info.status != 'OPEN':
                 # Unexpected status
                 self.logger.log(f"[MARKET] Unexpected status: {order_info.status}, cancel_reason: {order_info.cancel_reason}", "WARNING")
                 return OrderResult(
@@ -618,6 +745,24 @@ class ParadexClient(BaseExchangeClient):
             status='TIMEOUT'
         )
 
+    async def place_market_orders_batch(self, orders: List[OrderSpec]) -> List[OrderResult]:
+        """Place multiple market orders in a single submission round.
+
+        The Paradex SDK has no native batch endpoint, so the legs are submitted
+        concurrently over the shared HTTP client to collapse the per-order
+        round-trips into one execution window.
+
+        Args:
+            orders: List of OrderSpec describing each leg
+
+        Returns:
+            List of OrderResult (or Exception) in the same order as the specs
+        """
+        return await asyncio.gather(
+            *(self.place_market_order(spec.contract_id, spec.quantity, spec.side) for spec in orders),
+            return_exceptions=True
+        )
+
     async def cancel_order(self, order_id: str) -> OrderResult:
         """Cancel an order with Paradex using official SDK."""
         try:
@@ -796,6 +941,17 @@ class ParadexClient(BaseExchangeClient):
 
         symbol = f"{ticker}-USD-PERP"
 
+        # Contract metadata changes rarely; reuse a recent cached answer
+        # instead of paying two metadata round-trips on every start
+        cached = contract_cache.get('paradex', ticker)
+        if cached:
+            self.config.contract_id = cached['contract_id']
+            self.min_notional = Decimal(cached['min_notional'])
+            self.order_size_increment = Decimal(cached['order_size_increment'])
+            self.config.tick_size = Decimal(cached['tick_size'])
+            await self._subscribe_bbo()
+            return self.config.contract_id, self.config.tick_size
+
         market = await self._fetch_market_with_retry(symbol)
         market_summary = await self._fetch_markets_summary_with_retry(symbol)
 
@@ -824,4 +980,15 @@ class ParadexClient(BaseExchangeClient):
             self.logger.log("Failed to get tick size", "ERROR")
             raise ValueError("Failed to get tick size")
 
+        contract_cache.put('paradex', ticker, {
+            'contract_id': self.config.contract_id,
+            'tick_size': str(self.config.tick_size),
+            'min_notional': str(min_notional),
+            'order_size_increment': str(self.order_size_increment),
+        })
+
+        # If the WebSocket connected before the market was known, start BBO
+        # streaming now so cached prices are available immediately
+        await self._subscribe_bbo()
+
         return self.config.contract_id, self.config.tick_size
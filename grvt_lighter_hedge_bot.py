@@ -4,19 +4,37 @@ Cross-Exchange Hedge Bot - GRVT ↔ Lighter Hedging for Volume Generation
 
 import os
 import asyncio
-import traceback
-from dataclasses import dataclass
-from decimal import Decimal
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_DOWN
 from typing import Optional, Tuple
 
 from exchanges.grvt import GrvtClient
 from exchanges.lighter import LighterClient
+from hedge_base import HedgeRunMixin
 from helpers import TradingLogger
 from helpers.lark_bot import LarkBot
 from helpers.telegram_bot import TelegramBot
 
+# Maximum age of a prefetched BBO snapshot before it's considered stale
+BBO_STALENESS_SECS = 2.0
+# Minimum interval between GRVT order-book REST fetches. GRVT has no WS BBO
+# feed, so the tick-driven monitor must not translate every Lighter tick
+# into a blocking REST round trip
+GRVT_BBO_MIN_INTERVAL_SECS = 1.0
+# Lighter default leverage (actual margin = notional / leverage)
+LIGHTER_LEVERAGE = Decimal('35')
 
-@dataclass
+# Multiplying by 0.5 skips the Decimal division path when taking mid prices
+HALF = Decimal('0.5')
+
+# Parsed once at import instead of per calculation
+HUNDRED = Decimal(100)
+
+# Notional deviation (in %) beyond which the hedge is considered unbalanced
+MAX_NOTIONAL_DEVIATION_PCT = Decimal('15')
+
+
+@dataclass(slots=True)
 class CrossHedgeConfig:
     """Configuration class for cross-exchange hedge trading parameters."""
     ticker: str
@@ -30,9 +48,28 @@ class CrossHedgeConfig:
     cycle_wait: int = 20  # Wait time between trading cycles in seconds
     contract_id: str = ''
     tick_size: Decimal = Decimal(0)
-
-
-@dataclass
+    # Derived in __post_init__; declared so the slotted class has storage
+    open_sides: Tuple[str, str] = field(init=False)
+    close_sides: Tuple[str, str] = field(init=False)
+    pnl_signs: Tuple[Decimal, Decimal] = field(init=False)
+    mode_desc: str = field(init=False)
+
+    def __post_init__(self):
+        # Single source of truth for reverse-mode semantics: (grvt, lighter)
+        # sides for opening/closing and the per-venue P&L signs
+        if self.reverse:
+            self.open_sides = ('sell', 'buy')   # GRVT SHORT + Lighter LONG
+            self.close_sides = ('buy', 'sell')
+            self.pnl_signs = (Decimal(-1), Decimal(1))
+            self.mode_desc = "Reverse mode: GRVT SHORT (maker) + Lighter LONG (taker)"
+        else:
+            self.open_sides = ('buy', 'sell')   # GRVT LONG + Lighter SHORT
+            self.close_sides = ('sell', 'buy')
+            self.pnl_signs = (Decimal(1), Decimal(-1))
+            self.mode_desc = "Normal mode: GRVT LONG (maker) + Lighter SHORT (taker)"
+
+
+@dataclass(slots=True)
 class CrossPositionState:
     """Track position state for both exchanges."""
     grvt_order_id: Optional[str] = None
@@ -41,12 +78,30 @@ class CrossPositionState:
     lighter_entry_price: Optional[Decimal] = None
     grvt_quantity: Optional[Decimal] = None
     lighter_quantity: Optional[Decimal] = None
+    # Entry notionals cached at open time so the monitor loop doesn't
+    # re-multiply price * quantity every iteration
+    grvt_notional: Optional[Decimal] = None
+    lighter_notional: Optional[Decimal] = None
     entry_time: Optional[float] = None
     is_open: bool = False
     emergency_close: bool = False  # Flag for emergency market order close (stop loss/take profit)
 
-
-class GrvtLighterHedgeBot:
+    def reset(self):
+        """Clear all fields in place so the same instance tracks the next cycle."""
+        self.grvt_order_id = None
+        self.lighter_order_id = None
+        self.grvt_entry_price = None
+        self.lighter_entry_price = None
+        self.grvt_quantity = None
+        self.lighter_quantity = None
+        self.grvt_notional = None
+        self.lighter_notional = None
+        self.entry_time = None
+        self.is_open = False
+        self.emergency_close = False
+
+
+class GrvtLighterHedgeBot(HedgeRunMixin):
     """Cross-exchange hedge trading bot for volume generation (GRVT ↔ Lighter)."""
 
     def __init__(self, config: CrossHedgeConfig):
@@ -55,12 +110,32 @@ class GrvtLighterHedgeBot:
 
         # Position tracking
         self.position = CrossPositionState()
-        self.shutdown_requested = False
+        self._init_run_state()
 
         # Create separate clients for GRVT and Lighter
         self.grvt_client = None
         self.lighter_client = None
 
+        # Notification credentials don't change at runtime - read them once
+        self._lark_token = os.getenv("LARK_TOKEN")
+        self._tg_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        self._tg_chat = os.getenv("TELEGRAM_CHAT_ID")
+        # Persistent Lark client (created in initialize) so each alert reuses
+        # one aiohttp session instead of paying a TLS handshake per message
+        self._lark_bot = None
+
+        # Strong references to in-flight notify() tasks; the event loop only
+        # keeps weak ones, so an unreferenced alert task could be collected
+        # and silently dropped
+        self._notify_tasks = set()
+
+        # Last GRVT BBO REST result as (bid, ask, fetched_at); serves
+        # tick-driven re-checks inside GRVT_BBO_MIN_INTERVAL_SECS
+        self._grvt_bbo_cache = None
+
+        # Throttle for the per-iteration P&L log line
+        self._last_pnl_log_t = 0.0
+
     def _create_client_config(self, ticker: str, exchange: str) -> object:
         """Create configuration for an exchange client instance."""
         class MinimalConfig:
@@ -84,72 +159,73 @@ class GrvtLighterHedgeBot:
         try:
             self.logger.log("Initializing GRVT and Lighter clients...", "INFO")
 
-            # Initialize GRVT Client
-            self.logger.log("Connecting to GRVT...", "INFO")
-            grvt_config = self._create_client_config(self.config.ticker, 'grvt')
-            self.grvt_client = GrvtClient(grvt_config)
-            await self.grvt_client.connect()
+            # Bind the running loop's clock once; every later timestamp is a
+            # plain method call instead of an event-loop lookup
+            self._bind_loop_clock()
 
-            # Get GRVT contract attributes
-            grvt_contract_id, grvt_tick_size = await self.grvt_client.get_contract_attributes()
-            self.logger.log(f"GRVT: {self.config.ticker} = {grvt_contract_id}", "INFO")
+            # Open the Lark session once and reuse it for every notification
+            if self._lark_token:
+                self._lark_bot = await LarkBot(self._lark_token).__aenter__()
 
-            # Initialize Lighter Client
-            self.logger.log("Connecting to Lighter...", "INFO")
+            grvt_config = self._create_client_config(self.config.ticker, 'grvt')
+            self.grvt_client = GrvtClient(grvt_config)
 
-            # Create Lighter config
             lighter_config = self._create_client_config(self.config.ticker, 'lighter')
             self.lighter_client = LighterClient(lighter_config)
 
-            # CRITICAL: Get contract_id BEFORE connecting to ensure WebSocket subscribes to correct channel
-            lighter_contract_id, lighter_tick_size = await self.lighter_client.get_contract_attributes()
+            # The two venues have opposite ordering constraints: GRVT must
+            # connect before resolving contract attributes, while Lighter must
+            # resolve its market ID BEFORE connecting so the WebSocket
+            # subscribes to the correct channel. Interleave the phases so each
+            # step overlaps with the other venue's independent work.
+            self.logger.log("Connecting to GRVT and resolving Lighter market...", "INFO")
+            _, (lighter_contract_id, lighter_tick_size) = await asyncio.gather(
+                self.grvt_client.connect(),
+                self.lighter_client.get_contract_attributes()
+            )
             self.logger.log(f"Lighter: {self.config.ticker} = Market ID {lighter_contract_id}", "INFO")
 
             # Set contract_id in client config BEFORE connecting
             self.lighter_client.config.contract_id = lighter_contract_id
             self.lighter_client.config.tick_size = lighter_tick_size
 
-            # Now connect with correct contract_id set
-            await self.lighter_client.connect()
+            self.logger.log("Connecting to Lighter and resolving GRVT contract...", "INFO")
+            (grvt_contract_id, grvt_tick_size), _ = await asyncio.gather(
+                self.grvt_client.get_contract_attributes(),
+                self.lighter_client.connect()
+            )
+            self.logger.log(f"GRVT: {self.config.ticker} = {grvt_contract_id}", "INFO")
 
             # Store contract info (use GRVT's for general config)
             self.config.contract_id = grvt_contract_id
             self.config.tick_size = grvt_tick_size
 
-            # Wait for WebSocket connections to be fully established
-            self.logger.log("Waiting for WebSocket connections to establish...", "INFO")
-            await asyncio.sleep(10)
-
-            # Verify WebSocket connections are ready
-            max_retries = 10
-            for i in range(max_retries):
-                grvt_ready = True  # GRVT usually ready immediately
-                lighter_ready = (hasattr(self.lighter_client, 'ws_manager') and
-                                self.lighter_client.ws_manager and
-                                self.lighter_client.ws_manager.best_bid)
-
-                if lighter_ready:
-                    self.logger.log("WebSocket connections established and data streaming", "INFO")
-                    break
-                else:
-                    self.logger.log(f"Waiting for Lighter WebSocket data... ({i+1}/{max_retries})", "INFO")
-                    await asyncio.sleep(2)
-
-            if not lighter_ready:
+            # Wait for the first Lighter BBO frame instead of a flat 10 s
+            # sleep - startup proceeds the moment data is streaming (GRVT BBO
+            # is fetched over REST, so only Lighter gates readiness here)
+            self.logger.log("Waiting for WebSocket market data...", "INFO")
+            tick_event = self.lighter_client.price_tick_event
+            try:
+                if tick_event is not None:
+                    await asyncio.wait_for(tick_event.wait(), timeout=30)
+                self.logger.log("WebSocket connections established and data streaming", "INFO")
+            except asyncio.TimeoutError:
                 self.logger.log("Warning: Lighter WebSocket may not be fully ready", "WARNING")
 
             self.logger.log("Both exchanges initialized successfully", "INFO")
 
         except Exception as e:
             self.logger.log(f"Error initializing exchanges: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
             raise
 
-    async def _calculate_quantity_from_margin(self, target_price: Decimal, order_side: str) -> Decimal:
+    def _calculate_quantity_from_margin(self, target_price: Decimal, order_side: str) -> Decimal:
         """Calculate position quantity based on margin and GRVT's actual order price.
 
         This method ensures that the actual notional value on GRVT matches the target margin,
-        accounting for order_size_increment precision truncation.
+        accounting for order_size_increment precision truncation. Plain
+        function (no awaits), so repeated calls in the retry loop don't pay
+        a coroutine-frame allocation.
 
         Args:
             target_price: GRVT's actual order price (not average)
@@ -158,19 +234,20 @@ class GrvtLighterHedgeBot:
         Returns:
             Position quantity (adjusted for GRVT's order_size_increment precision)
         """
-        # Ensure target_price is Decimal
-        target_price = Decimal(str(target_price))
-
-        # Calculate raw quantity based on target margin
+        # Calculate raw quantity based on target margin (callers pass Decimal)
         raw_quantity = self.config.margin / target_price
 
         # Get GRVT's order size increment (precision requirement)
         grvt_increment = self.grvt_client.order_size_increment
 
         # CRITICAL: Use ROUND_DOWN to ensure we don't exceed the margin budget
-        from decimal import ROUND_DOWN
         adjusted_quantity = raw_quantity.quantize(grvt_increment, rounding=ROUND_DOWN)
 
+        # The notional/deviation math below exists purely for monitoring, so
+        # skip it entirely when INFO logging is disabled
+        if not self.logger.enabled_for("INFO"):
+            return adjusted_quantity
+
         # Calculate actual notional value after precision truncation
         actual_notional = adjusted_quantity * target_price
 
@@ -183,8 +260,8 @@ class GrvtLighterHedgeBot:
         )
 
         # Warn if precision truncation causes significant deviation
-        deviation_pct = abs(actual_notional - self.config.margin) / self.config.margin * Decimal('100')
-        if deviation_pct > Decimal('15'):
+        deviation_pct = abs(actual_notional - self.config.margin) / self.config.margin * HUNDRED
+        if deviation_pct > MAX_NOTIONAL_DEVIATION_PCT:
             self.logger.log(
                 f"⚠️ Precision truncation warning: actual notional deviates {deviation_pct:.2f}% from target margin",
                 "WARNING"
@@ -192,6 +269,46 @@ class GrvtLighterHedgeBot:
 
         return adjusted_quantity
 
+    async def _get_grvt_bbo(self) -> Tuple[Decimal, Decimal]:
+        """GRVT BBO with a minimum re-fetch interval.
+
+        The monitor wakes on every Lighter tick, but GRVT prices only come
+        over a blocking REST order-book call, so re-checks inside the
+        interval are served from the last fetch. Decouples the wakeup
+        frequency from the REST fetch frequency.
+        """
+        cached = self._grvt_bbo_cache
+        if cached is not None and self._loop_time() - cached[2] < GRVT_BBO_MIN_INTERVAL_SECS:
+            return cached[0], cached[1]
+
+        bid, ask = await self.grvt_client.fetch_bbo_prices(self.config.contract_id)
+        self._grvt_bbo_cache = (bid, ask, self._loop_time())
+        return bid, ask
+
+    async def _fetch_both_bbos(self) -> Tuple[Tuple[Decimal, Decimal], Tuple[Decimal, Decimal]]:
+        """Fetch GRVT and Lighter BBOs concurrently."""
+        try:
+            return await asyncio.gather(
+                self._get_grvt_bbo(),
+                self.lighter_client.fetch_bbo_prices(self.lighter_client.config.contract_id)
+            )
+        except Exception as e:
+            self.logger.log(f"BBO fetch failed: {e}", "ERROR")
+            raise
+
+    async def _prefetch_lighter_bbo(self) -> Tuple[Decimal, Decimal, float]:
+        """Fetch the Lighter BBO with a completion timestamp.
+
+        Runs as a background task while the GRVT fill wait is in flight so
+        the hedge leg can reuse the snapshot instead of doing its own lookup.
+        The full Lighter payload cannot be pre-signed because the SDK
+        allocates the nonce internally at send time, so overlapping the BBO
+        lookup is the portion of the hedge path that can be prepared ahead.
+        """
+        bid, ask = await self.lighter_client.fetch_bbo_prices(
+            self.lighter_client.config.contract_id)
+        return bid, ask, self._loop_time()
+
     async def _get_average_price(self) -> Decimal:
         """Get average price across both exchanges (for monitoring/logging only).
 
@@ -201,16 +318,14 @@ class GrvtLighterHedgeBot:
         Returns:
             Average mid price (for reference only)
         """
-        # Get GRVT prices
-        grvt_bid, grvt_ask = await self.grvt_client.fetch_bbo_prices(self.config.contract_id)
-        grvt_mid = (Decimal(str(grvt_bid)) + Decimal(str(grvt_ask))) / Decimal('2')
-
-        # Get Lighter prices
-        lighter_bid, lighter_ask = await self.lighter_client.fetch_bbo_prices(self.lighter_client.config.contract_id)
-        lighter_mid = (Decimal(str(lighter_bid)) + Decimal(str(lighter_ask))) / Decimal('2')
+        # Fetch both venues concurrently - the lookups are independent, so
+        # this costs max(RTT_grvt, RTT_lighter) instead of the sum
+        (grvt_bid, grvt_ask), (lighter_bid, lighter_ask) = await self._fetch_both_bbos()
+        grvt_mid = (grvt_bid + grvt_ask) * HALF
+        lighter_mid = (lighter_bid + lighter_ask) * HALF
 
         # Calculate average
-        avg_mid = (grvt_mid + lighter_mid) / Decimal('2')
+        avg_mid = (grvt_mid + lighter_mid) * HALF
 
         self.logger.log(f"Prices: GRVT={grvt_mid}, Lighter={lighter_mid}, Avg={avg_mid}", "INFO")
 
@@ -231,23 +346,17 @@ class GrvtLighterHedgeBot:
         try:
             self.logger.log("=== Opening Cross-Exchange Hedge Positions ===", "INFO")
 
-            # Determine sides based on reverse flag
-            if self.config.reverse:
-                grvt_side = 'sell'  # GRVT SHORT
-                lighter_side = 'buy'   # Lighter LONG
-                mode_desc = "Reverse mode: GRVT SHORT (maker) + Lighter LONG (taker)"
-            else:
-                grvt_side = 'buy'   # GRVT LONG
-                lighter_side = 'sell'  # Lighter SHORT
-                mode_desc = "Normal mode: GRVT LONG (maker) + Lighter SHORT (taker)"
+            # Sides are resolved once in CrossHedgeConfig.__post_init__
+            grvt_side, lighter_side = self.config.open_sides
 
-            self.logger.log(mode_desc, "INFO")
+            self.logger.log(self.config.mode_desc, "INFO")
 
             # Dynamic retry loop for GRVT open order (infinite retries until filled)
             retry_timeout = 10  # 10 seconds per attempt
             grvt_result = None
             filled = False
             attempt = 0
+            lighter_bbo_task = None
 
             while not filled and not self.shutdown_requested:
                 attempt += 1
@@ -273,7 +382,7 @@ class GrvtLighterHedgeBot:
                     continue
 
                 # Calculate quantity based on GRVT's actual order price (recalculate each time for accuracy)
-                quantity = await self._calculate_quantity_from_margin(grvt_order_price, grvt_side)
+                quantity = self._calculate_quantity_from_margin(grvt_order_price, grvt_side)
 
                 # Log attempt
                 self.logger.log(
@@ -297,27 +406,24 @@ class GrvtLighterHedgeBot:
                     await asyncio.sleep(0.5)
                     continue
 
-                # Wait for order to fill (3 seconds timeout)
-                start_time = asyncio.get_event_loop().time()
+                # Overlap the Lighter BBO lookup with the GRVT fill wait
+                # so the hedge leg doesn't pay its own lookup after the fill
+                lighter_bbo_task = asyncio.create_task(self._prefetch_lighter_bbo())
 
-                while asyncio.get_event_loop().time() - start_time < retry_timeout:
+                # Wait for the WS-pushed fill; fall back to a REST check on
+                # timeout in case the push was missed
+                order_info = await self.grvt_client.wait_for_fill(
+                    grvt_result.order_id, timeout=retry_timeout)
+                if order_info is None:
                     order_info = await self.grvt_client.get_order_info(order_id=grvt_result.order_id)
 
-                    # GRVT uses 'FILLED' status (not Paradex's 'CLOSED')
-                    if order_info and order_info.status == 'FILLED' and order_info.filled_size > 0:
-                        filled = True
-                        grvt_result.filled_size = order_info.filled_size
-                        grvt_result.price = order_info.price
-                        self.logger.log(
-                            f"✓ GRVT open order filled on attempt {attempt}: "
-                            f"{order_info.filled_size} @ {order_info.price}",
-                            "INFO"
-                        )
-                        break
-
-                    await asyncio.sleep(0.2)  # Check every 200ms
-
-                if filled:
+                # GRVT uses 'FILLED' status (not Paradex's 'CLOSED')
+                if order_info and order_info.status == 'FILLED' and order_info.filled_size > 0:
+                    filled = True
+                    grvt_result.filled_size = order_info.filled_size
+                    grvt_result.price = order_info.price
+                    # Fill logging happens below, after the hedge leg is in
+                    # flight - the WS payload already carries size and price
                     break
 
                 # Not filled within timeout - cancel and retry
@@ -335,14 +441,33 @@ class GrvtLighterHedgeBot:
                 self.logger.log("Opening positions interrupted by shutdown request", "WARNING")
                 return False
 
-            # Step 2: Immediately place Lighter market order to hedge
+            # Consume the BBO prefetched during the fill wait (only if still fresh)
+            lighter_bbo = None
+            if lighter_bbo_task is not None:
+                try:
+                    bid, ask, fetched_at = await lighter_bbo_task
+                    if self._loop_time() - fetched_at < BBO_STALENESS_SECS and 0 < bid < ask:
+                        lighter_bbo = (bid, ask)
+                except Exception as e:
+                    self.logger.log(f"Lighter BBO prefetch failed: {e}", "WARNING")
+
+            # Step 2: Immediately place Lighter market order to hedge. The
+            # send is scheduled first so its network round trip overlaps the
+            # fill/hedge log writes instead of waiting behind them
+            hedge_task = asyncio.create_task(self.lighter_client.place_market_order(
+                self.lighter_client.config.contract_id,
+                grvt_result.filled_size,  # Use actual filled size from GRVT
+                lighter_side,
+                bbo=lighter_bbo
+            ))
+            self.logger.log(
+                f"✓ GRVT open order filled on attempt {attempt}: "
+                f"{grvt_result.filled_size} @ {grvt_result.price}",
+                "INFO"
+            )
             self.logger.log(f"Placing Lighter {lighter_side.upper()} market order to hedge...", "INFO")
             try:
-                lighter_result = await self.lighter_client.place_market_order(
-                    self.lighter_client.config.contract_id,
-                    grvt_result.filled_size,  # Use actual filled size from GRVT
-                    lighter_side
-                )
+                lighter_result = await hedge_task
             except Exception as e:
                 self.logger.log(f"Lighter hedge failed: {e}", "ERROR")
                 # Rollback GRVT position
@@ -363,17 +488,19 @@ class GrvtLighterHedgeBot:
             self.position.lighter_entry_price = lighter_result.price
             self.position.grvt_quantity = grvt_result.filled_size
             self.position.lighter_quantity = lighter_result.filled_size or grvt_result.filled_size
-            self.position.entry_time = asyncio.get_event_loop().time()
+            self.position.entry_time = self._loop_time()
             self.position.is_open = True
 
             # ========== Calculate and verify actual notional values ==========
             grvt_notional = self.position.grvt_quantity * self.position.grvt_entry_price
             lighter_notional = self.position.lighter_quantity * self.position.lighter_entry_price
+            self.position.grvt_notional = grvt_notional
+            self.position.lighter_notional = lighter_notional
             target_margin = self.config.margin
 
             # Calculate deviations
-            grvt_deviation_pct = abs(grvt_notional - target_margin) / target_margin * Decimal('100')
-            lighter_deviation_pct = abs(lighter_notional - target_margin) / target_margin * Decimal('100')
+            grvt_deviation_pct = abs(grvt_notional - target_margin) / target_margin * HUNDRED
+            lighter_deviation_pct = abs(lighter_notional - target_margin) / target_margin * HUNDRED
 
             self.logger.log(f"✓ GRVT {grvt_side.upper()} (maker): {self.position.grvt_quantity} @ {self.position.grvt_entry_price}", "INFO")
             self.logger.log(f"✓ Lighter {lighter_side.upper()} (taker): {self.position.lighter_quantity} @ {self.position.lighter_entry_price}", "INFO")
@@ -387,14 +514,14 @@ class GrvtLighterHedgeBot:
             )
 
             # Warn if deviations are significant
-            if grvt_deviation_pct > Decimal('15'):
+            if grvt_deviation_pct > MAX_NOTIONAL_DEVIATION_PCT:
                 self.logger.log(
                     f"⚠️ GRVT notional deviation: {grvt_deviation_pct:.2f}% "
                     f"(actual: {grvt_notional:.2f}, target: {target_margin:.2f})",
                     "WARNING"
                 )
 
-            if lighter_deviation_pct > Decimal('15'):
+            if lighter_deviation_pct > MAX_NOTIONAL_DEVIATION_PCT:
                 self.logger.log(
                     f"⚠️ Lighter notional deviation: {lighter_deviation_pct:.2f}% "
                     f"(actual: {lighter_notional:.2f}, target: {target_margin:.2f})",
@@ -408,7 +535,7 @@ class GrvtLighterHedgeBot:
 
         except Exception as e:
             self.logger.log(f"Error opening hedge positions: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
             return False
 
     async def _rollback_grvt_position(self, order_result, close_side: str):
@@ -431,7 +558,7 @@ class GrvtLighterHedgeBot:
 
         except Exception as e:
             self.logger.log(f"Error during GRVT rollback: {e}", "ERROR")
-            await self.send_notification(f"⚠️ CRITICAL: GRVT rollback failed: {e}")
+            self.notify(f"⚠️ CRITICAL: GRVT rollback failed: {e}")
 
     async def _emergency_market_close(self, grvt_close_side: str, lighter_close_side: str):
         """Emergency close using market orders on both exchanges (for stop loss/take profit).
@@ -462,32 +589,32 @@ class GrvtLighterHedgeBot:
             # Check GRVT result
             if isinstance(grvt_result, Exception):
                 self.logger.log(f"❌ GRVT market close failed: {grvt_result}", "ERROR")
-                await self.send_notification(f"🚨 CRITICAL: GRVT emergency close failed: {grvt_result}")
+                self.notify(f"🚨 CRITICAL: GRVT emergency close failed: {grvt_result}")
             elif grvt_result.success and grvt_result.status == 'FILLED':
                 self.logger.log(f"✓ GRVT closed (market): {grvt_result.filled_size} @ {grvt_result.price}", "INFO")
             else:
                 self.logger.log(f"❌ GRVT market close unsuccessful: status={grvt_result.status}", "ERROR")
-                await self.send_notification(f"🚨 CRITICAL: GRVT emergency close status: {grvt_result.status}")
+                self.notify(f"🚨 CRITICAL: GRVT emergency close status: {grvt_result.status}")
 
             # Check Lighter result
             if isinstance(lighter_result, Exception):
                 self.logger.log(f"❌ Lighter market close failed: {lighter_result}", "ERROR")
-                await self.send_notification(f"🚨 CRITICAL: Lighter emergency close failed: {lighter_result}")
+                self.notify(f"🚨 CRITICAL: Lighter emergency close failed: {lighter_result}")
             elif lighter_result.success and lighter_result.status == 'FILLED':
                 self.logger.log(f"✓ Lighter closed (market): {lighter_result.filled_size} @ {lighter_result.price}", "INFO")
             else:
                 self.logger.log(f"❌ Lighter market close unsuccessful: status={lighter_result.status}", "ERROR")
-                await self.send_notification(f"🚨 CRITICAL: Lighter emergency close status: {lighter_result.status}")
+                self.notify(f"🚨 CRITICAL: Lighter emergency close status: {lighter_result.status}")
 
             # Reset position state
-            self.position = CrossPositionState()
+            self.position.reset()
 
             self.logger.log("=== EMERGENCY CLOSE COMPLETED ===", "INFO")
 
         except Exception as e:
             self.logger.log(f"❌ Critical error during emergency close: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
-            await self.send_notification(f"🚨 CRITICAL: Emergency close exception: {e}")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
+            self.notify(f"🚨 CRITICAL: Emergency close exception: {e}")
 
     async def _check_stop_conditions(self) -> Tuple[bool, str]:
         """Check if stop-loss or take-profit conditions are met (using absolute USDC values).
@@ -499,35 +626,25 @@ class GrvtLighterHedgeBot:
             return False, ""
 
         try:
-            # Get current prices
-            grvt_bid, grvt_ask = await self.grvt_client.fetch_bbo_prices(self.config.contract_id)
-            grvt_price = (Decimal(str(grvt_bid)) + Decimal(str(grvt_ask))) / Decimal('2')
+            # Get current prices from both venues concurrently
+            (grvt_bid, grvt_ask), (lighter_bid, lighter_ask) = await self._fetch_both_bbos()
+            grvt_price = (grvt_bid + grvt_ask) * HALF
+            lighter_price = (lighter_bid + lighter_ask) * HALF
 
-            lighter_bid, lighter_ask = await self.lighter_client.fetch_bbo_prices(self.lighter_client.config.contract_id)
-            lighter_price = (Decimal(str(lighter_bid)) + Decimal(str(lighter_ask))) / Decimal('2')
-
-            # Calculate absolute P&L in USDC based on direction
+            # Calculate absolute P&L in USDC based on direction, using the
+            # per-venue signs resolved in CrossHedgeConfig.__post_init__
             # NOTE: GRVT uses full margin (no leverage), Lighter uses ~35x leverage
+            grvt_sign, lighter_sign = self.config.pnl_signs
 
             # GRVT P&L (no leverage, uses full notional value)
-            if self.config.reverse:
-                grvt_pnl_usdc = (self.position.grvt_entry_price - grvt_price) * self.position.grvt_quantity
-            else:
-                grvt_pnl_usdc = (grvt_price - self.position.grvt_entry_price) * self.position.grvt_quantity
+            grvt_pnl_usdc = grvt_sign * (grvt_price - self.position.grvt_entry_price) * self.position.grvt_quantity
 
             # Lighter P&L (with leverage, need to calculate based on actual margin)
             # Lighter default leverage is ~35x, so actual margin = notional / 35
-            lighter_leverage = Decimal('35')
-            lighter_notional = self.position.lighter_entry_price * self.position.lighter_quantity
-            lighter_actual_margin = lighter_notional / lighter_leverage
-
-            # Calculate Lighter price change percentage
-            if self.config.reverse:
-                # Lighter LONG
-                lighter_pnl_pct = (lighter_price - self.position.lighter_entry_price) / self.position.lighter_entry_price
-            else:
-                # Lighter SHORT
-                lighter_pnl_pct = (self.position.lighter_entry_price - lighter_price) / self.position.lighter_entry_price
+            lighter_actual_margin = self.position.lighter_notional / LIGHTER_LEVERAGE
+
+            # Lighter price change percentage (LONG in reverse mode, SHORT otherwise)
+            lighter_pnl_pct = lighter_sign * (lighter_price - self.position.lighter_entry_price) / self.position.lighter_entry_price
 
             # Lighter P&L in USDC = actual margin * price change percentage
             lighter_pnl_usdc = lighter_actual_margin * lighter_pnl_pct
@@ -535,17 +652,21 @@ class GrvtLighterHedgeBot:
             # Calculate total P&L
             total_pnl_usdc = grvt_pnl_usdc + lighter_pnl_usdc
 
-            # Calculate percentage P&L for logging
-            grvt_pnl_pct = (grvt_pnl_usdc / (self.position.grvt_entry_price * self.position.grvt_quantity)) * Decimal('100')
-            # For Lighter, calculate percentage based on actual margin used (with leverage)
-            lighter_display_pnl_pct = (lighter_pnl_usdc / lighter_actual_margin) * Decimal('100')
-
-            self.logger.log(
-                f"P&L: GRVT={grvt_pnl_pct:.2f}% ({grvt_pnl_usdc:+.2f} USDC), "
-                f"Lighter={lighter_display_pnl_pct:.2f}% ({lighter_pnl_usdc:+.2f} USDC, margin={lighter_actual_margin:.2f}), "
-                f"Total={total_pnl_usdc:+.2f} USDC",
-                "INFO"
-            )
+            # Log P&L at most once per second - the percentage math and the
+            # six Decimal-to-str conversions are for display only, so skipped
+            # iterations still run the threshold checks below
+            now = self._loop_time()
+            if now - self._last_pnl_log_t >= 1.0 and self.logger.enabled_for("INFO"):
+                self._last_pnl_log_t = now
+                grvt_pnl_pct = (grvt_pnl_usdc / self.position.grvt_notional) * HUNDRED
+                # For Lighter, calculate percentage based on actual margin used (with leverage)
+                lighter_display_pnl_pct = (lighter_pnl_usdc / lighter_actual_margin) * HUNDRED
+                self.logger.log(
+                    f"P&L: GRVT={grvt_pnl_pct:.2f}% ({grvt_pnl_usdc:+.2f} USDC), "
+                    f"Lighter={lighter_display_pnl_pct:.2f}% ({lighter_pnl_usdc:+.2f} USDC, margin={lighter_actual_margin:.2f}), "
+                    f"Total={total_pnl_usdc:+.2f} USDC",
+                    "INFO"
+                )
 
             # Check stop loss (total P&L in USDC)
             if total_pnl_usdc <= -self.config.max_loss_usdc:
@@ -575,13 +696,8 @@ class GrvtLighterHedgeBot:
                 self.logger.log("No open positions to close", "WARNING")
                 return
 
-            # Determine close sides based on reverse flag
-            if self.config.reverse:
-                grvt_close_side = 'buy'   # Close SHORT
-                lighter_close_side = 'sell'  # Close LONG
-            else:
-                grvt_close_side = 'sell'  # Close LONG
-                lighter_close_side = 'buy'   # Close SHORT
+            # Close sides are resolved once in CrossHedgeConfig.__post_init__
+            grvt_close_side, lighter_close_side = self.config.close_sides
 
             # Check if emergency close (stop loss/take profit triggered)
             if self.position.emergency_close:
@@ -594,10 +710,26 @@ class GrvtLighterHedgeBot:
             retry_timeout = 3  # 3 seconds per attempt
             grvt_close = None
             filled = False
+            cancel_task = None
 
             for attempt in range(1, max_retries + 1):
-                # Get fresh BBO prices for each attempt
-                grvt_bid, grvt_ask = await self.grvt_client.fetch_bbo_prices(self.config.contract_id)
+                # Get fresh BBO prices for each attempt, overlapped with the
+                # previous attempt's in-flight cancel (one fewer RTT per
+                # retry); the cancel is settled before the next place goes out
+                if cancel_task is not None:
+                    bbo_result, cancel_result = await asyncio.gather(
+                        self.grvt_client.fetch_bbo_prices(self.config.contract_id),
+                        cancel_task,
+                        return_exceptions=True
+                    )
+                    cancel_task = None
+                    if isinstance(cancel_result, Exception):
+                        self.logger.log(f"Error canceling order: {cancel_result}", "WARNING")
+                    if isinstance(bbo_result, Exception):
+                        raise bbo_result
+                    grvt_bid, grvt_ask = bbo_result
+                else:
+                    grvt_bid, grvt_ask = await self.grvt_client.fetch_bbo_prices(self.config.contract_id)
 
                 # Calculate close price for POST_ONLY order (dynamic price adjustment)
                 if grvt_close_side == 'sell':
@@ -631,35 +763,37 @@ class GrvtLighterHedgeBot:
                     await asyncio.sleep(0.5)
                     continue
 
-                # Wait for order to fill (3 seconds timeout)
-                start_time = asyncio.get_event_loop().time()
-
-                while asyncio.get_event_loop().time() - start_time < retry_timeout:
+                # Wait for the WS-pushed fill; fall back to a REST check on
+                # timeout in case the push was missed
+                order_info = await self.grvt_client.wait_for_fill(
+                    grvt_close.order_id, timeout=retry_timeout)
+                if order_info is None:
                     order_info = await self.grvt_client.get_order_info(order_id=grvt_close.order_id)
 
-                    if order_info and order_info.status == 'FILLED' and order_info.filled_size > 0:
-                        filled = True
-                        grvt_close.filled_size = order_info.filled_size
-                        grvt_close.price = order_info.price
-                        self.logger.log(
-                            f"✓ GRVT closed (POST_ONLY) on attempt {attempt}: "
-                            f"{order_info.filled_size} @ {order_info.price}",
-                            "INFO"
-                        )
-                        break
-
-                    await asyncio.sleep(0.2)  # Check every 200ms
-
-                if filled:
+                if order_info and order_info.status == 'FILLED' and order_info.filled_size > 0:
+                    filled = True
+                    grvt_close.filled_size = order_info.filled_size
+                    grvt_close.price = order_info.price
+                    self.logger.log(
+                        f"✓ GRVT closed (POST_ONLY) on attempt {attempt}: "
+                        f"{order_info.filled_size} @ {order_info.price}",
+                        "INFO"
+                    )
                     break
 
-                # Not filled within 3 seconds - cancel and retry
+                # Not filled within 3 seconds - cancel and retry, letting the
+                # cancel overlap the next attempt's BBO fetch
                 self.logger.log(
                     f"Order not filled within {retry_timeout}s, canceling and retrying...",
                     "INFO"
                 )
+                cancel_task = asyncio.create_task(
+                    self.grvt_client.cancel_order(grvt_close.order_id))
+
+            # Settle a cancel left in flight by the final iteration
+            if cancel_task is not None:
                 try:
-                    await self.grvt_client.cancel_order(grvt_close.order_id)
+                    await cancel_task
                 except Exception as e:
                     self.logger.log(f"Error canceling order: {e}", "WARNING")
 
@@ -671,7 +805,7 @@ class GrvtLighterHedgeBot:
                     "ERROR"
                 )
                 self.logger.log("🚨 FALLBACK: Executing emergency market order to close position", "WARNING")
-                await self.send_notification(
+                self.notify(
                     f"⚠️ GRVT limit order failed after {max_retries} attempts, "
                     f"falling back to market order"
                 )
@@ -700,26 +834,63 @@ class GrvtLighterHedgeBot:
                 self.logger.log("⚠️ GRVT closed but Lighter still open - POSITION IMBALANCE", "ERROR")
 
             # Reset position state
-            self.position = CrossPositionState()
+            self.position.reset()
 
             self.logger.log("=== Cross-Exchange Hedge Positions Closed ===", "INFO")
 
         except Exception as e:
             self.logger.log(f"Error closing hedge positions: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
+
+    async def _send_lark(self, message: str):
+        """Send a message via Lark if configured."""
+        if self._lark_bot is not None:
+            await self._lark_bot.send_text(message)
+        elif self._lark_token:
+            # Fallback for messages sent before initialize() has run
+            async with LarkBot(self._lark_token) as lark_bot:
+                await lark_bot.send_text(message)
+
+    async def _send_telegram(self, message: str):
+        """Send a message via Telegram if configured.
+
+        The Telegram client is synchronous, so run it in a worker thread to
+        keep the event loop responsive.
+        """
+        if self._tg_token and self._tg_chat:
+            def _send():
+                with TelegramBot(self._tg_token, self._tg_chat) as tg_bot:
+                    tg_bot.send_text(message)
+            await asyncio.to_thread(_send)
 
     async def send_notification(self, message: str):
-        """Send notification via Telegram/Lark."""
-        lark_token = os.getenv("LARK_TOKEN")
-        if lark_token:
-            async with LarkBot(lark_token) as lark_bot:
-                await lark_bot.send_text(message)
+        """Send notification via Telegram/Lark, both channels in parallel."""
+        await asyncio.gather(
+            self._send_lark(message),
+            self._send_telegram(message),
+            return_exceptions=True
+        )
 
-        telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
-        if telegram_token and telegram_chat_id:
-            with TelegramBot(telegram_token, telegram_chat_id) as tg_bot:
-                tg_bot.send_text(message)
+    def notify(self, message: str):
+        """Fire-and-forget notification for hot paths.
+
+        Schedules delivery without blocking the caller on the HTTPS
+        round-trips. The task is retained until done so it cannot be
+        garbage-collected mid-flight.
+        """
+        task = asyncio.create_task(self.send_notification(message))
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    def _price_tick_event(self):
+        """Lighter carries the streamed feed; GRVT prices come over REST, so
+        the monitor timeout caps the wait between re-evaluations either way.
+        """
+        return self.lighter_client.price_tick_event
+
+    def _on_stop_condition(self, reason: str):
+        # Set emergency close flag for market order execution
+        self.position.emergency_close = True
 
     async def run(self):
         """Main trading loop - continuous hedge cycle with configurable interval."""
@@ -752,26 +923,7 @@ class GrvtLighterHedgeBot:
                         continue
 
                     # Monitor position until hold time expires or stop conditions met
-                    start_time = asyncio.get_event_loop().time()
-
-                    while self.position.is_open and not self.shutdown_requested:
-                        # Check time
-                        elapsed = asyncio.get_event_loop().time() - start_time
-
-                        if elapsed >= self.config.hold_time:
-                            self.logger.log(f"Hold time expired ({self.config.hold_time}s)", "INFO")
-                            break
-
-                        # Check stop conditions
-                        should_close, reason = await self._check_stop_conditions()
-                        if should_close:
-                            self.logger.log(f"Stop condition met: {reason}", "INFO")
-                            # Set emergency close flag for market order execution
-                            self.position.emergency_close = True
-                            break
-
-                        # Sleep and check again
-                        await asyncio.sleep(1)
+                    await self._monitor_until_stop()
 
                     # Close positions
                     await self._close_hedge_positions()
@@ -782,14 +934,14 @@ class GrvtLighterHedgeBot:
 
                 except Exception as e:
                     self.logger.log(f"Error in trading cycle: {e}", "ERROR")
-                    self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+                    self.logger.log("Traceback", "ERROR", exc_info=True)
                     await asyncio.sleep(self.config.cycle_wait)
 
         except KeyboardInterrupt:
             self.logger.log("Bot stopped by user", "INFO")
         except Exception as e:
             self.logger.log(f"Critical error: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
             await self.send_notification(f"⚠️ GRVT ↔ Lighter Hedge Bot Critical Error: {e}")
         finally:
             # Cleanup
@@ -798,6 +950,15 @@ class GrvtLighterHedgeBot:
                     self.logger.log("Closing open positions before shutdown...", "INFO")
                     await self._close_hedge_positions()
 
+                # Let scheduled alerts finish before tearing down the Lark
+                # session they post through
+                if self._notify_tasks:
+                    await asyncio.wait(self._notify_tasks, timeout=5)
+
+                if self._lark_bot is not None:
+                    await self._lark_bot.__aexit__(None, None, None)
+                    self._lark_bot = None
+
                 if self.grvt_client:
                     await self.grvt_client.disconnect()
                 if self.lighter_client:
@@ -0,0 +1,109 @@
+"""
+Shared run-loop machinery for the hedge bots.
+
+GrvtLighterHedgeBot and HedgeVolumeBot clone the same shutdown and
+position-monitoring plumbing; hosting it here means optimizations to the
+event-driven wait, interruptible sleep or bound loop clock land once
+instead of drifting between copies.
+"""
+
+import asyncio
+import time
+
+
+class HedgeRunMixin:
+    """Shutdown coordination and position monitoring shared by the hedge bots.
+
+    Host classes must provide ``self.config`` (with ``hold_time``),
+    ``self.position`` (with ``is_open``), ``self.logger`` and
+    ``_check_stop_conditions()``, and should override ``_price_tick_event()``
+    to expose the event pulsed on each streamed BBO update.
+    """
+
+    def _init_run_state(self):
+        """Set up shutdown flags and the bound clock; call from __init__.
+
+        The clock starts as time.monotonic and is rebound to the running
+        loop's clock by _bind_loop_clock() so hot paths avoid the deprecated
+        asyncio.get_event_loop() lookup on every timestamp.
+        """
+        self.shutdown_requested = False
+        self._shutdown_event = asyncio.Event()
+        self._loop_time = time.monotonic
+
+    def _bind_loop_clock(self):
+        """Rebind the timestamp clock to the running event loop's clock."""
+        self._loop_time = asyncio.get_running_loop().time
+
+    def _install_signal_handlers(self):
+        """Wake sleeping waits on SIGINT/SIGTERM for a prompt shutdown."""
+        import signal
+        try:
+            loop = asyncio.get_running_loop()
+            loop.add_signal_handler(signal.SIGINT, self.request_shutdown)
+            loop.add_signal_handler(signal.SIGTERM, self.request_shutdown)
+        except NotImplementedError:
+            # Windows event loop - fall back to KeyboardInterrupt
+            pass
+
+    def request_shutdown(self):
+        """Flag a graceful shutdown and wake any waiting loop immediately."""
+        self.shutdown_requested = True
+        self._shutdown_event.set()
+
+    async def _interruptible_sleep(self, seconds: float):
+        """Sleep that returns early as soon as shutdown is requested."""
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+    def _price_tick_event(self):
+        """Return the event pulsed on each streamed BBO update, or None.
+
+        Overridden by the host to point at whichever client carries the
+        WebSocket price feed; None falls back to plain polling sleeps.
+        """
+        return None
+
+    async def _wait_for_price_tick(self, timeout: float):
+        """Sleep until a new price tick arrives, or timeout.
+
+        Replaces a fixed polling delay in the monitor loop: stop conditions
+        are re-checked as soon as the WebSocket delivers a fresh BBO instead
+        of up to ``timeout`` seconds later.
+        """
+        event = self._price_tick_event()
+        if event is None:
+            await asyncio.sleep(timeout)
+            return
+
+        event.clear()
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _on_stop_condition(self, reason: str):
+        """Hook invoked when a stop condition fires; default is a no-op."""
+
+    async def _monitor_until_stop(self):
+        """Watch the open position until hold time expires or a stop fires."""
+        loop_time = self._loop_time
+        deadline = loop_time() + self.config.hold_time
+
+        while self.position.is_open and not self.shutdown_requested:
+            # Check time
+            if loop_time() >= deadline:
+                self.logger.log(f"Hold time expired ({self.config.hold_time}s)", "INFO")
+                return
+
+            # Check stop conditions
+            should_close, reason = await self._check_stop_conditions()
+            if should_close:
+                self.logger.log(f"Stop condition met: {reason}", "INFO")
+                self._on_stop_condition(reason)
+                return
+
+            # Wake on the next price tick (or after 1 s) and check again
+            await self._wait_for_price_tick(1.0)
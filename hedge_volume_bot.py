@@ -3,18 +3,33 @@ Hedge Volume Bot - Dual Account High-Frequency Hedge Trading for Volume Generati
 """
 
 import os
+import sys
 import asyncio
-import traceback
+import time
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional, Tuple
 from datetime import datetime
 
 from exchanges.lighter import LighterClient
+from hedge_base import HedgeRunMixin
 from helpers import TradingLogger
+from helpers import contract_cache
 from helpers.lark_bot import LarkBot
 from helpers.telegram_bot import TelegramBot
 
+# Maximum age of a streamed BBO snapshot before falling back to REST
+BBO_STALENESS_SECS = 2.0
+# Multiplying by 0.5 skips the Decimal division path when taking mid prices
+HALF = Decimal('0.5')
+
+# Typed config defaults built once at import, so the default path skips the
+# string parse in Decimal.__new__
+_DEFAULT_MARGIN = Decimal('100')
+_DEFAULT_HOLD_TIME = 300
+_DEFAULT_TAKE_PROFIT = Decimal('50')
+_DEFAULT_STOP_LOSS = Decimal('50')
+
 
 @dataclass
 class HedgeConfig:
@@ -27,6 +42,39 @@ class HedgeConfig:
     contract_id: str = ''
     tick_size: Decimal = Decimal(0)
 
+    @classmethod
+    def from_env(cls, args) -> 'HedgeConfig':
+        """Build the config from CLI args with env-var fallbacks.
+
+        Reads one snapshot of the environment; explicit arguments win over
+        the HEDGE_* variables, which win over the defaults.
+        """
+        env = dict(os.environ)
+
+        def _resolve(arg_value, env_key, default, caster):
+            if arg_value is not None:
+                return arg_value
+            raw = env.get(env_key)
+            return caster(raw) if raw is not None else default
+
+        return cls(
+            # Interned so every downstream ticker comparison is a pointer
+            # check; validity is established against the live market list
+            # during initialize()
+            ticker=sys.intern(args.ticker.upper()),
+            margin=_resolve(args.margin, 'HEDGE_MARGIN', _DEFAULT_MARGIN, Decimal),
+            hold_time=_resolve(args.hold_time, 'HEDGE_POSITION_HOLD_TIME', _DEFAULT_HOLD_TIME, int),
+            take_profit=_resolve(args.take_profit, 'HEDGE_TAKE_PROFIT', _DEFAULT_TAKE_PROFIT, Decimal),
+            stop_loss=_resolve(args.stop_loss, 'HEDGE_STOP_LOSS', _DEFAULT_STOP_LOSS, Decimal),
+        )
+
+    def __post_init__(self):
+        # Float mirrors for the per-tick stop check: the thresholds are only
+        # compared against, never rounded into an order, so float precision
+        # is more than enough and ~50x cheaper than Decimal arithmetic
+        self.take_profit_f = float(self.take_profit)
+        self.stop_loss_neg_f = -float(self.stop_loss)
+
 
 @dataclass
 class PositionState:
@@ -37,11 +85,18 @@ class PositionState:
     account2_entry_price: Optional[Decimal] = None
     account1_quantity: Optional[Decimal] = None
     account2_quantity: Optional[Decimal] = None
+    # Float mirrors of the entry prices plus percentage-per-price-unit
+    # factors, cached at open so each tick's P&L is plain float arithmetic;
+    # Decimal stays authoritative for everything that reaches an order
+    account1_entry_f: Optional[float] = None
+    account2_entry_f: Optional[float] = None
+    account1_inv_entry_f: Optional[float] = None
+    account2_inv_entry_f: Optional[float] = None
     entry_time: Optional[float] = None
     is_open: bool = False
 
 
-class HedgeVolumeBot:
+class HedgeVolumeBot(HedgeRunMixin):
     """Dual-account hedge trading bot for volume generation."""
 
     def __init__(self, config: HedgeConfig):
@@ -50,12 +105,26 @@ class HedgeVolumeBot:
 
         # Position tracking
         self.position = PositionState()
-        self.shutdown_requested = False
+        self._init_run_state()
 
         # Create two separate Lighter clients
         self.account1_client = None  # Will open LONG positions
         self.account2_client = None  # Will open SHORT positions
 
+        # One ApiClient shared by both accounts so their REST traffic rides
+        # a single connection pool; owned (and closed) by this bot
+        self._shared_api_client = None
+
+        # Notification config read once; the Lark client is opened once in
+        # initialize() and reused so each alert skips a TLS handshake
+        self._lark_token = os.getenv("LARK_TOKEN")
+        self._tg_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        self._tg_chat = os.getenv("TELEGRAM_CHAT_ID")
+        self._lark_bot = None
+
+        # Throttle for the per-tick P&L log line
+        self._last_pnl_log_t = 0.0
+
     def _create_lighter_config(self, ticker: str, account_suffix: str) -> dict:
         """Create configuration for a Lighter client instance."""
         # Create a minimal config object that LighterClient expects
@@ -79,103 +148,108 @@ class HedgeVolumeBot:
     async def initialize(self):
         """Initialize both Lighter clients with separate credentials."""
         try:
+            self._bind_loop_clock()
             self.logger.log("Initializing dual Lighter accounts...", "INFO")
 
-            # Store original environment variables
-            original_api_key = os.getenv('API_KEY_PRIVATE_KEY')
-            original_account_index = os.getenv('LIGHTER_ACCOUNT_INDEX')
-            original_api_key_index = os.getenv('LIGHTER_API_KEY_INDEX')
-
-            # Initialize Account 1 (LONG)
-            os.environ['API_KEY_PRIVATE_KEY'] = os.getenv('API_KEY_PRIVATE_KEY_1')
-            os.environ['LIGHTER_ACCOUNT_INDEX'] = os.getenv('LIGHTER_ACCOUNT_INDEX_1')
-            os.environ['LIGHTER_API_KEY_INDEX'] = os.getenv('LIGHTER_API_KEY_INDEX_1')
-
-            # First, get contract info using a temporary API client (without WebSocket)
-            self.logger.log("Getting contract information...", "INFO")
+            # Open the Lark session once for the bot's lifetime
+            if self._lark_token:
+                self._lark_bot = await LarkBot(self._lark_token).__aenter__()
+
+            # Read each account's credentials once and pass them into the
+            # clients explicitly; no process-wide os.environ mutation
+            creds1 = (os.getenv('API_KEY_PRIVATE_KEY_1'),
+                      os.getenv('LIGHTER_ACCOUNT_INDEX_1'),
+                      os.getenv('LIGHTER_API_KEY_INDEX_1'))
+            creds2 = (os.getenv('API_KEY_PRIVATE_KEY_2'),
+                      os.getenv('LIGHTER_ACCOUNT_INDEX_2'),
+                      os.getenv('LIGHTER_API_KEY_INDEX_2'))
+
+            # The shared API client is injected into both account clients so
+            # a second TLS handshake is never paid
             from lighter import ApiClient, Configuration, OrderApi
-            temp_api_client = ApiClient(configuration=Configuration(host="https://mainnet.zklighter.elliot.ai"))
-            order_api = OrderApi(temp_api_client)
-            order_books = await order_api.order_books()
-
-            # Find the market for our ticker
-            market_info = None
-            for market in order_books.order_books:
-                if market.symbol == self.config.ticker:
-                    self.config.contract_id = market.market_id
-                    self.config.tick_size = Decimal("1") / (Decimal("10") ** market.supported_price_decimals)
-                    market_info = market
-                    self.logger.log(f"Found contract: {self.config.ticker} = Market ID {self.config.contract_id}", "INFO")
-                    break
-
-            await temp_api_client.close()
-
-            if not self.config.contract_id:
-                raise ValueError(f"Ticker {self.config.ticker} not found")
+            self._shared_api_client = ApiClient(configuration=Configuration(host="https://mainnet.zklighter.elliot.ai"))
+
+            # Contract metadata changes rarely; reuse a recent cached answer
+            # instead of downloading the full order-book list on every start
+            cached = contract_cache.get('lighter', self.config.ticker)
+            if cached:
+                self.config.contract_id = cached['contract_id']
+                self.config.tick_size = Decimal(cached['tick_size'])
+                base_amount_multiplier = cached['base_amount_multiplier']
+                price_multiplier = cached['price_multiplier']
+                self.logger.log(f"Found contract (cached): {self.config.ticker} = Market ID {self.config.contract_id}", "INFO")
+            else:
+                self.logger.log("Getting contract information...", "INFO")
+                order_api = OrderApi(self._shared_api_client)
+                order_books = await order_api.order_books()
+
+                # Dict lookup instead of a linear scan over every market
+                market_info = {m.symbol: m for m in order_books.order_books}.get(self.config.ticker)
+                if market_info is None:
+                    raise ValueError(f"Ticker {self.config.ticker} not found")
+
+                self.config.contract_id = market_info.market_id
+                self.config.tick_size = Decimal("1") / (Decimal("10") ** market_info.supported_price_decimals)
+                base_amount_multiplier = pow(10, market_info.supported_size_decimals)
+                price_multiplier = pow(10, market_info.supported_price_decimals)
+                self.logger.log(f"Found contract: {self.config.ticker} = Market ID {self.config.contract_id}", "INFO")
+
+                contract_cache.put('lighter', self.config.ticker, {
+                    'contract_id': self.config.contract_id,
+                    'tick_size': str(self.config.tick_size),
+                    'base_amount_multiplier': base_amount_multiplier,
+                    'price_multiplier': price_multiplier,
+                })
 
             # Now initialize clients with contract_id already set
             config1 = self._create_lighter_config(self.config.ticker, '1')
             config1.contract_id = self.config.contract_id
             config1.tick_size = self.config.tick_size
-            self.account1_client = LighterClient(config1)
-
-            # Set the multipliers from market_info
-            self.account1_client.base_amount_multiplier = pow(10, market_info.supported_size_decimals)
-            self.account1_client.price_multiplier = pow(10, market_info.supported_price_decimals)
-
-            self.logger.log("Connecting Account 1 (LONG)...", "INFO")
-            await self.account1_client.connect()
+            self.account1_client = LighterClient(config1, api_client=self._shared_api_client,
+                                                 api_key_private_key=creds1[0],
+                                                 account_index=creds1[1],
+                                                 api_key_index=creds1[2])
 
-            # Initialize Account 2 (SHORT)
-            os.environ['API_KEY_PRIVATE_KEY'] = os.getenv('API_KEY_PRIVATE_KEY_2')
-            os.environ['LIGHTER_ACCOUNT_INDEX'] = os.getenv('LIGHTER_ACCOUNT_INDEX_2')
-            os.environ['LIGHTER_API_KEY_INDEX'] = os.getenv('LIGHTER_API_KEY_INDEX_2')
+            # Set the multipliers resolved above
+            self.account1_client.base_amount_multiplier = base_amount_multiplier
+            self.account1_client.price_multiplier = price_multiplier
 
-            # Initialize Account 2 with same contract info
+            # Initialize Account 2 (SHORT) with same contract info
             config2 = self._create_lighter_config(self.config.ticker, '2')
             config2.contract_id = self.config.contract_id
             config2.tick_size = self.config.tick_size
-            self.account2_client = LighterClient(config2)
-
-            # Set the multipliers from market_info
-            self.account2_client.base_amount_multiplier = pow(10, market_info.supported_size_decimals)
-            self.account2_client.price_multiplier = pow(10, market_info.supported_price_decimals)
-
-            self.logger.log("Connecting Account 2 (SHORT)...", "INFO")
-            await self.account2_client.connect()
-
-            # Restore original environment variables
-            if original_api_key:
-                os.environ['API_KEY_PRIVATE_KEY'] = original_api_key
-            if original_account_index:
-                os.environ['LIGHTER_ACCOUNT_INDEX'] = original_account_index
-            if original_api_key_index:
-                os.environ['LIGHTER_API_KEY_INDEX'] = original_api_key_index
-
-            # Wait for WebSocket connections to be fully established
-            self.logger.log("Waiting for WebSocket connections to establish...", "INFO")
-            await asyncio.sleep(10)
-
-            # Verify WebSocket connections are ready
-            max_retries = 10
-            for i in range(max_retries):
-                if (hasattr(self.account1_client, 'ws_manager') and
-                    self.account1_client.ws_manager and
-                    self.account1_client.ws_manager.best_bid and
-                    hasattr(self.account2_client, 'ws_manager') and
-                    self.account2_client.ws_manager and
-                    self.account2_client.ws_manager.best_bid):
-                    self.logger.log("WebSocket connections established and data streaming", "INFO")
-                    break
-                else:
-                    self.logger.log(f"Waiting for WebSocket data... ({i+1}/{max_retries})", "INFO")
-                    await asyncio.sleep(2)
+            self.account2_client = LighterClient(config2, api_client=self._shared_api_client,
+                                                 api_key_private_key=creds2[0],
+                                                 account_index=creds2[1],
+                                                 api_key_index=creds2[2])
+
+            # Set the multipliers resolved above
+            self.account2_client.base_amount_multiplier = base_amount_multiplier
+            self.account2_client.price_multiplier = price_multiplier
+
+            # The handshakes are independent I/O, so run them in parallel
+            self.logger.log("Connecting Account 1 (LONG) and Account 2 (SHORT)...", "INFO")
+            await asyncio.gather(self.account1_client.connect(),
+                                 self.account2_client.connect())
+
+            # Wait for the first BBO frame from each account instead of a flat
+            # 10 s sleep - startup proceeds the moment data is streaming
+            self.logger.log("Waiting for WebSocket market data...", "INFO")
+            waiters = [event.wait() for event in (self.account1_client.price_tick_event,
+                                                  self.account2_client.price_tick_event)
+                       if event is not None]
+            try:
+                if waiters:
+                    await asyncio.wait_for(asyncio.gather(*waiters), timeout=20)
+                self.logger.log("WebSocket connections established and data streaming", "INFO")
+            except asyncio.TimeoutError:
+                self.logger.log("Warning: WebSocket feeds may not be fully ready", "WARNING")
 
             self.logger.log("Both accounts initialized successfully", "INFO")
 
         except Exception as e:
             self.logger.log(f"Error initializing accounts: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
             raise
 
     async def _calculate_quantity_from_margin(self, current_price: Decimal) -> Decimal:
@@ -209,12 +283,9 @@ class HedgeVolumeBot:
         try:
             self.logger.log("=== Opening Hedge Positions ===", "INFO")
 
-            # Get current market price
-            best_bid, best_ask = await self.account1_client.fetch_bbo_prices(self.config.contract_id)
-            # Ensure Decimal types
-            best_bid = Decimal(str(best_bid))
-            best_ask = Decimal(str(best_ask))
-            mid_price = (best_bid + best_ask) / Decimal('2')
+            # Get current market price (streamed snapshot when fresh)
+            best_bid, best_ask = await self._get_bbo()
+            mid_price = (best_bid + best_ask) * HALF
 
             # Validate price
             if mid_price <= 0:
@@ -235,26 +306,32 @@ class HedgeVolumeBot:
 
             account1_result, account2_result = results
 
-            # Check for exceptions
-            if isinstance(account1_result, Exception):
-                self.logger.log(f"Account 1 (LONG) failed: {account1_result}", "ERROR")
-                return False
-
-            if isinstance(account2_result, Exception):
-                self.logger.log(f"Account 2 (SHORT) failed: {account2_result}", "ERROR")
-                # Rollback Account 1
-                await self._rollback_position(self.account1_client, account1_result, 'sell')
-                return False
-
-            # Check if both orders succeeded and filled
-            if not account1_result.success or account1_result.status != 'FILLED':
-                self.logger.log(f"Account 1 order not filled: status={account1_result.status}", "ERROR")
-                return False
-
-            if not account2_result.success or account2_result.status != 'FILLED':
-                self.logger.log(f"Account 2 order not filled: status={account2_result.status}", "ERROR")
-                # Rollback Account 1
-                await self._rollback_position(self.account1_client, account1_result, 'sell')
+            # Check both legs, collecting every failure and every leg that
+            # actually filled so any failure path unwinds all live exposure
+            failures = []
+            filled_legs = []
+            for label, client, result, close_side in (
+                    ('Account 1 (LONG)', self.account1_client, account1_result, 'sell'),
+                    ('Account 2 (SHORT)', self.account2_client, account2_result, 'buy')):
+                if isinstance(result, Exception):
+                    failures.append(f"{label} failed: {result}")
+                    continue
+                if result.filled_size and result.filled_size > 0:
+                    filled_legs.append((client, result, close_side))
+                if not result.success or result.status != 'FILLED':
+                    failures.append(f"{label} order not filled: status={result.status}")
+
+            if failures:
+                for message in failures:
+                    self.logger.log(message, "ERROR")
+                # Close every filled leg concurrently to minimise the
+                # unhedged window (one RTT instead of one per leg)
+                if filled_legs:
+                    await asyncio.gather(
+                        *(self._rollback_position(client, result, side)
+                          for client, result, side in filled_legs),
+                        return_exceptions=True
+                    )
                 return False
 
             # Store position state
@@ -264,7 +341,11 @@ class HedgeVolumeBot:
             self.position.account2_entry_price = account2_result.price
             self.position.account1_quantity = account1_result.filled_size or quantity
             self.position.account2_quantity = account2_result.filled_size or quantity
-            self.position.entry_time = asyncio.get_event_loop().time()
+            self.position.account1_entry_f = float(self.position.account1_entry_price)
+            self.position.account2_entry_f = float(self.position.account2_entry_price)
+            self.position.account1_inv_entry_f = 100.0 / self.position.account1_entry_f
+            self.position.account2_inv_entry_f = 100.0 / self.position.account2_entry_f
+            self.position.entry_time = self._loop_time()
             self.position.is_open = True
 
             self.logger.log(f"✓ Account 1 LONG: {self.position.account1_quantity} @ {self.position.account1_entry_price}", "INFO")
@@ -275,7 +356,7 @@ class HedgeVolumeBot:
 
         except Exception as e:
             self.logger.log(f"Error opening hedge positions: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
             return False
 
     async def _rollback_position(self, client: LighterClient, order_result, close_side: str):
@@ -301,35 +382,51 @@ class HedgeVolumeBot:
             self.logger.log(f"Error during rollback: {e}", "ERROR")
             await self.send_notification(f"⚠️ CRITICAL: Rollback failed for {client.get_exchange_name()}: {e}")
 
+    async def _get_bbo(self) -> Tuple[Decimal, Decimal]:
+        """Return the freshest BBO, preferring the streamed snapshot.
+
+        The WS cache is pure in-process state, so the common path costs no
+        network hop; REST is only consulted when the snapshot is stale.
+        """
+        cached = self.account1_client.get_cached_bbo()
+        if cached is not None:
+            bid, ask, ts = cached
+            if time.time() - ts <= BBO_STALENESS_SECS:
+                return bid, ask
+        return await self.account1_client.fetch_bbo_prices(self.config.contract_id)
+
     async def _check_stop_conditions(self) -> Tuple[bool, str]:
         """Check if stop-loss or take-profit conditions are met.
 
         Returns:
             Tuple of (should_close, reason)
         """
-        if not self.position.is_open:
+        # Bind hot attributes to locals; this runs on every price tick and
+        # each dotted lookup costs a __getattribute__ call
+        pos = self.position
+        if not pos.is_open:
             return False, ""
 
         try:
-            # Get current market price
-            best_bid, best_ask = await self.account1_client.fetch_bbo_prices(self.config.contract_id)
-            # Ensure Decimal types
-            best_bid = Decimal(str(best_bid))
-            best_ask = Decimal(str(best_ask))
-            current_price = (best_bid + best_ask) / Decimal('2')
-
-            # Calculate P&L for Account 1 (LONG)
-            account1_pnl_pct = ((current_price - self.position.account1_entry_price) /
-                               self.position.account1_entry_price * Decimal('100'))
-
-            # Calculate P&L for Account 2 (SHORT)
-            account2_pnl_pct = ((self.position.account2_entry_price - current_price) /
-                               self.position.account2_entry_price * Decimal('100'))
-
-            self.logger.log(f"P&L: Account1={account1_pnl_pct:.2f}%, Account2={account2_pnl_pct:.2f}%", "INFO")
+            # Get current market price (streamed snapshot when fresh, so the
+            # per-tick check is pure in-process arithmetic)
+            best_bid, best_ask = await self._get_bbo()
+
+            # Float fast path: the P&L here is only compared against
+            # thresholds, never submitted, so Decimal precision buys nothing
+            current_price = (float(best_bid) + float(best_ask)) * 0.5
+            account1_pnl_pct = (current_price - pos.account1_entry_f) * pos.account1_inv_entry_f
+            account2_pnl_pct = (pos.account2_entry_f - current_price) * pos.account2_inv_entry_f
+
+            # The check runs per order-book tick; logging every tick would
+            # mean a synchronous file write per update, so cap it at 1/s
+            now = self._loop_time()
+            if now - self._last_pnl_log_t >= 1.0 and self.logger.enabled_for("INFO"):
+                self._last_pnl_log_t = now
+                self.logger.log(f"P&L: Account1={account1_pnl_pct:.2f}%, Account2={account2_pnl_pct:.2f}%", "INFO")
 
             # Check stop loss for either account
-            stop_loss_threshold = -self.config.stop_loss
+            stop_loss_threshold = self.config.stop_loss_neg_f
             if account1_pnl_pct <= stop_loss_threshold:
                 return True, f"Account 1 Stop Loss triggered ({account1_pnl_pct:.2f}%)"
 
@@ -337,10 +434,11 @@ class HedgeVolumeBot:
                 return True, f"Account 2 Stop Loss triggered ({account2_pnl_pct:.2f}%)"
 
             # Check take profit for either account
-            if account1_pnl_pct >= self.config.take_profit:
+            take_profit = self.config.take_profit_f
+            if account1_pnl_pct >= take_profit:
                 return True, f"Account 1 Take Profit triggered ({account1_pnl_pct:.2f}%)"
 
-            if account2_pnl_pct >= self.config.take_profit:
+            if account2_pnl_pct >= take_profit:
                 return True, f"Account 2 Take Profit triggered ({account2_pnl_pct:.2f}%)"
 
             return False, ""
@@ -393,20 +491,40 @@ class HedgeVolumeBot:
 
         except Exception as e:
             self.logger.log(f"Error closing hedge positions: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
+
+    async def _send_lark(self, message: str):
+        """Send a message via Lark if configured."""
+        if self._lark_bot is not None:
+            await self._lark_bot.send_text(message)
+        elif self._lark_token:
+            # Fallback for messages sent before initialize() has run
+            async with LarkBot(self._lark_token) as lark_bot:
+                await lark_bot.send_text(message)
+
+    async def _send_telegram(self, message: str):
+        """Send a message via Telegram if configured.
+
+        The Telegram client is synchronous, so run it in a worker thread to
+        keep the event loop responsive.
+        """
+        if self._tg_token and self._tg_chat:
+            def _send():
+                with TelegramBot(self._tg_token, self._tg_chat) as tg_bot:
+                    tg_bot.send_text(message)
+            await asyncio.to_thread(_send)
 
     async def send_notification(self, message: str):
-        """Send notification via Telegram/Lark."""
-        lark_token = os.getenv("LARK_TOKEN")
-        if lark_token:
-            async with LarkBot(lark_token) as lark_bot:
-                await lark_bot.send_text(message)
+        """Send notification via Telegram/Lark, both channels in parallel."""
+        await asyncio.gather(
+            self._send_lark(message),
+            self._send_telegram(message),
+            return_exceptions=True
+        )
 
-        telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        telegram_chat_id = os.getenv("TELEGRAM_CHAT_ID")
-        if telegram_token and telegram_chat_id:
-            with TelegramBot(telegram_token, telegram_chat_id) as tg_bot:
-                tg_bot.send_text(message)
+    def _price_tick_event(self):
+        """Account 1's client carries the streamed feed for the monitor."""
+        return self.account1_client.price_tick_event
 
     async def run(self):
         """Main trading loop - continuous hedge cycle."""
@@ -414,6 +532,10 @@ class HedgeVolumeBot:
             # Initialize clients
             await self.initialize()
 
+            # Wake sleeping waits on SIGINT/SIGTERM so shutdown is not held
+            # up by a cycle pause
+            self._install_signal_handlers()
+
             # Log configuration
             self.logger.log("=== Hedge Volume Bot Configuration ===", "INFO")
             self.logger.log(f"Ticker: {self.config.ticker}", "INFO")
@@ -432,46 +554,29 @@ class HedgeVolumeBot:
 
                     if not success:
                         self.logger.log("Failed to open positions, retrying in 10 seconds...", "WARNING")
-                        await asyncio.sleep(10)
+                        await self._interruptible_sleep(10)
                         continue
 
                     # Monitor position until hold time expires or stop conditions met
-                    start_time = asyncio.get_event_loop().time()
-
-                    while self.position.is_open and not self.shutdown_requested:
-                        # Check time
-                        elapsed = asyncio.get_event_loop().time() - start_time
-
-                        if elapsed >= self.config.hold_time:
-                            self.logger.log(f"Hold time expired ({self.config.hold_time}s)", "INFO")
-                            break
-
-                        # Check stop conditions
-                        should_close, reason = await self._check_stop_conditions()
-                        if should_close:
-                            self.logger.log(f"Stop condition met: {reason}", "INFO")
-                            break
-
-                        # Sleep and check again
-                        await asyncio.sleep(1)
+                    await self._monitor_until_stop()
 
                     # Close positions
                     await self._close_hedge_positions()
 
                     # Brief pause before next cycle
                     self.logger.log("Waiting 5 seconds before next cycle...", "INFO")
-                    await asyncio.sleep(5)
+                    await self._interruptible_sleep(5)
 
                 except Exception as e:
                     self.logger.log(f"Error in trading cycle: {e}", "ERROR")
-                    self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
-                    await asyncio.sleep(10)
+                    self.logger.log("Traceback", "ERROR", exc_info=True)
+                    await self._interruptible_sleep(10)
 
         except KeyboardInterrupt:
             self.logger.log("Bot stopped by user", "INFO")
         except Exception as e:
             self.logger.log(f"Critical error: {e}", "ERROR")
-            self.logger.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.logger.log("Traceback", "ERROR", exc_info=True)
             await self.send_notification(f"⚠️ Hedge Bot Critical Error: {e}")
         finally:
             # Cleanup
@@ -480,11 +585,22 @@ class HedgeVolumeBot:
                     self.logger.log("Closing open positions before shutdown...", "INFO")
                     await self._close_hedge_positions()
 
+                # Close the persistent notification session after the final
+                # shutdown alerts have gone out
+                if self._lark_bot is not None:
+                    await self._lark_bot.__aexit__(None, None, None)
+                    self._lark_bot = None
+
                 if self.account1_client:
                     await self.account1_client.disconnect()
                 if self.account2_client:
                     await self.account2_client.disconnect()
 
+                # The shared API client outlives both account clients
+                if self._shared_api_client:
+                    await self._shared_api_client.close()
+                    self._shared_api_client = None
+
                 self.logger.log("Hedge bot shutdown complete", "INFO")
             except Exception as e:
                 self.logger.log(f"Error during shutdown: {e}", "ERROR")
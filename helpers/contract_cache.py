@@ -0,0 +1,49 @@
+"""
+On-disk cache for exchange contract metadata.
+
+Contract attributes (market id, tick size, size increments) change very
+rarely, but every bot start pays a metadata round-trip per exchange to fetch
+them. This module memoizes those lookups across restarts so a supervised bot
+that restarts frequently can skip the network calls entirely.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CACHE_PATH = Path.home() / ".cache" / "cross_hedge" / "contracts.json"
+CACHE_TTL_SECS = 24 * 60 * 60
+
+
+def _load() -> Dict[str, Any]:
+    try:
+        with open(CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def get(exchange: str, ticker: str) -> Optional[Dict[str, Any]]:
+    """Return cached attributes for (exchange, ticker) if still fresh."""
+    entry = _load().get(f"{exchange}:{ticker}")
+    if not entry:
+        return None
+    if time.time() - entry.get("fetched_at", 0) > CACHE_TTL_SECS:
+        return None
+    return entry
+
+
+def put(exchange: str, ticker: str, attributes: Dict[str, Any]) -> None:
+    """Store attributes for (exchange, ticker), timestamped for TTL checks."""
+    data = _load()
+    entry = dict(attributes)
+    entry["fetched_at"] = time.time()
+    data[f"{exchange}:{ticker}"] = entry
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_PATH, "w") as f:
+            json.dump(data, f)
+    except OSError:
+        # The cache is best-effort; never fail a lookup over a write error
+        pass
@@ -0,0 +1,49 @@
+"""
+Cached .env loading.
+
+dotenv tokenizes the env file line by line on every launch; this module
+pickles the parsed key/value map next to the file, keyed by mtime, so
+subsequent launches replace the parse with a single pickle read. Edits
+to the env file invalidate the cache automatically.
+"""
+
+import os
+import pickle
+
+
+def fast_load_dotenv(path: str) -> None:
+    """Load the env file at ``path`` into os.environ, caching the parse.
+
+    Semantics match dotenv.load_dotenv's default: variables already
+    present in the environment are not overridden. Missing files are
+    ignored, and cache writes are best-effort.
+    """
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return
+
+    cache_path = f"{path}.cache.pkl"
+    values = None
+    try:
+        with open(cache_path, 'rb') as fh:
+            cached_mtime, cached_values = pickle.load(fh)
+        if cached_mtime == mtime:
+            values = cached_values
+    except (OSError, pickle.PickleError, ValueError, EOFError):
+        pass
+
+    if values is None:
+        import dotenv
+        values = {k: v for k, v in dotenv.dotenv_values(path).items() if v is not None}
+        try:
+            # The cache duplicates the env file's secrets, so create it
+            # owner-read/write only rather than with the process umask
+            fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as fh:
+                pickle.dump((mtime, values), fh)
+        except OSError:
+            pass
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
@@ -79,19 +79,38 @@ class TradingLogger:
 
         return logger
 
-    def log(self, message: str, level: str = "INFO"):
-        """Log a message with the specified level."""
-        formatted_message = f"[{self.exchange.upper()}_{self.ticker.upper()}] {message}"
-        if level.upper() == "DEBUG":
-            self.logger.debug(formatted_message)
-        elif level.upper() == "INFO":
-            self.logger.info(formatted_message)
-        elif level.upper() == "WARNING":
-            self.logger.warning(formatted_message)
-        elif level.upper() == "ERROR":
-            self.logger.error(formatted_message)
-        else:
-            self.logger.info(formatted_message)
+    _LEVELS = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+    }
+
+    def enabled_for(self, level: str = "INFO") -> bool:
+        """Return True if a message at this level would actually be emitted.
+
+        Lets hot paths skip building expensive log strings entirely.
+        """
+        return self.logger.isEnabledFor(self._LEVELS.get(level.upper(), logging.INFO))
+
+    def log(self, message: str, level: str = "INFO", *args, exc_info=False):
+        """Log a message with the specified level.
+
+        Extra positional args are %-interpolated into the message only when
+        the level is enabled, so hot paths can defer formatting:
+        ``logger.log("P&L: %+.2f", "DEBUG", pnl)``.
+
+        Pass ``exc_info=True`` inside an except block to append the current
+        traceback; the handler formats it on demand, so no frame walking
+        happens when the record is discarded.
+        """
+        numeric_level = self._LEVELS.get(level.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(numeric_level):
+            return
+        if args:
+            message = message % args
+        self.logger.log(numeric_level, f"[{self.exchange.upper()}_{self.ticker.upper()}] {message}",
+                        exc_info=exc_info)
 
     def log_transaction(self, order_id: str, side: str, quantity: Decimal, price: Decimal, status: str):
         """Log a transaction to CSV file."""
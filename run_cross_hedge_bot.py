@@ -12,6 +12,14 @@ from pathlib import Path
 from decimal import Decimal
 import dotenv
 
+# Use the libuv-backed event loop when available - pure win for a bot that
+# is all concurrent network I/O
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from cross_exchange_hedge_bot import CrossExchangeHedgeBot, CrossHedgeConfig
 
 
@@ -55,17 +63,21 @@ def setup_logging(log_level: str):
     logging.getLogger('lighter').setLevel(logging.WARNING)
 
 
+# Built once at import instead of per validation call
+_REQUIRED_VARS = (
+    'PARADEX_L1_ADDRESS',
+    'PARADEX_L2_PRIVATE_KEY',
+    'API_KEY_PRIVATE_KEY',
+    'LIGHTER_ACCOUNT_INDEX',
+    'LIGHTER_API_KEY_INDEX',
+)
+
+
 def validate_env_variables():
     """Validate required environment variables."""
-    required_vars = [
-        'PARADEX_L1_ADDRESS',
-        'PARADEX_L2_PRIVATE_KEY',
-        'API_KEY_PRIVATE_KEY',
-        'LIGHTER_ACCOUNT_INDEX',
-        'LIGHTER_API_KEY_INDEX',
-    ]
-
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    # One snapshot of the environment instead of a proxy lookup per var
+    env = dict(os.environ)
+    missing_vars = [var for var in _REQUIRED_VARS if not env.get(var)]
 
     if missing_vars:
         print(f"Error: Missing required environment variables: {', '.join(missing_vars)}")
@@ -8,12 +8,77 @@ import asyncio
 import logging
 import os
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 from decimal import Decimal
 import dotenv
 
+# Use the libuv-backed event loop when available - pure win for a bot that
+# is all concurrent network I/O
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from grvt_lighter_hedge_bot import GrvtLighterHedgeBot, CrossHedgeConfig
 
+# Credentials both exchange clients read from the environment
+REQUIRED_ENV_VARS = (
+    # GRVT Configuration
+    'GRVT_TRADING_ACCOUNT_ID',
+    'GRVT_PRIVATE_KEY',
+    'GRVT_API_KEY',
+    # Lighter Configuration
+    'API_KEY_PRIVATE_KEY',
+    'LIGHTER_ACCOUNT_INDEX',
+    'LIGHTER_API_KEY_INDEX',
+)
+
+
+class ConfigError(Exception):
+    """Raised when required environment configuration is missing."""
+
+
+@dataclass(frozen=True, slots=True)
+class CrossHedgeEnv:
+    """Trading parameters resolved from CLI arguments and the environment.
+
+    Validation and type coercion happen once in from_env(); afterwards the
+    instance is immutable.
+    """
+    margin: Decimal
+    hold_time: int
+    take_profit: Decimal
+    stop_loss: Decimal
+    reverse: bool
+    cycle_wait: int
+    max_loss_usdc: Decimal
+    max_profit_usdc: Decimal
+
+    @classmethod
+    def from_env(cls, args) -> 'CrossHedgeEnv':
+        """Build the config from args with env-var fallbacks, in one pass.
+
+        Raises ConfigError naming every missing required variable at once.
+        """
+        # One snapshot of the environment instead of a proxy lookup per var
+        env = dict(os.environ)
+        missing = [var for var in REQUIRED_ENV_VARS if not env.get(var)]
+        if missing:
+            raise ConfigError(', '.join(missing))
+
+        return cls(
+            margin=args.margin if args.margin else Decimal(os.getenv('CROSS_HEDGE_MARGIN', '100')),
+            hold_time=args.hold_time if args.hold_time else int(os.getenv('CROSS_HEDGE_POSITION_HOLD_TIME', '300')),
+            take_profit=args.take_profit if args.take_profit else Decimal(os.getenv('CROSS_HEDGE_TAKE_PROFIT', '50')),
+            stop_loss=args.stop_loss if args.stop_loss else Decimal(os.getenv('CROSS_HEDGE_STOP_LOSS', '50')),
+            reverse=os.getenv('CROSS_HEDGE_REVERSE', 'false').lower() == 'true',
+            cycle_wait=int(os.getenv('CROSS_HEDGE_CYCLE_WAIT', '20')),
+            max_loss_usdc=Decimal(os.getenv('CROSS_HEDGE_MAX_LOSS_USDC', '50')),
+            max_profit_usdc=Decimal(os.getenv('CROSS_HEDGE_MAX_PROFIT_USDC', '100')),
+        )
+
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -55,41 +120,32 @@ def setup_logging(log_level: str):
     logging.getLogger('lighter').setLevel(logging.WARNING)
 
 
-def validate_env_variables():
-    """Validate required environment variables."""
-    required_vars = [
-        # GRVT Configuration
-        'GRVT_TRADING_ACCOUNT_ID',
-        'GRVT_PRIVATE_KEY',
-        'GRVT_API_KEY',
-        # Lighter Configuration
-        'API_KEY_PRIVATE_KEY',
-        'LIGHTER_ACCOUNT_INDEX',
-        'LIGHTER_API_KEY_INDEX',
-    ]
-
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-
-    if missing_vars:
-        print(f"Error: Missing required environment variables: {', '.join(missing_vars)}")
-        print("\nPlease ensure your .env file contains:")
-        print("  # GRVT Configuration")
-        print("  GRVT_TRADING_ACCOUNT_ID=<your_trading_account_id>")
-        print("  GRVT_PRIVATE_KEY=<your_private_key>")
-        print("  GRVT_API_KEY=<your_api_key>")
-        print("  GRVT_ENVIRONMENT=prod  # or testnet")
-        print("\n  # Lighter Configuration")
-        print("  API_KEY_PRIVATE_KEY=<your_api_key_private_key>")
-        print("  LIGHTER_ACCOUNT_INDEX=<your_account_index>")
-        print("  LIGHTER_API_KEY_INDEX=<your_api_key_index>")
-        print("\n  # Cross-Exchange Hedge Bot Configuration")
-        print("  CROSS_HEDGE_MARGIN=<margin_in_usdc>")
-        print("  CROSS_HEDGE_POSITION_HOLD_TIME=<hold_time_seconds>")
-        print("  CROSS_HEDGE_TAKE_PROFIT=<take_profit_percentage> (optional, default 50)")
-        print("  CROSS_HEDGE_STOP_LOSS=<stop_loss_percentage> (optional, default 50)")
-        print("  CROSS_HEDGE_REVERSE=false (optional, default false)")
-        print("  CROSS_HEDGE_CYCLE_WAIT=20 (optional, default 20)")
-        sys.exit(1)
+# Single blob so the error path is one write instead of one per line
+_ENV_HELP = """
+Please ensure your .env file contains:
+  # GRVT Configuration
+  GRVT_TRADING_ACCOUNT_ID=<your_trading_account_id>
+  GRVT_PRIVATE_KEY=<your_private_key>
+  GRVT_API_KEY=<your_api_key>
+  GRVT_ENVIRONMENT=prod  # or testnet
+
+  # Lighter Configuration
+  API_KEY_PRIVATE_KEY=<your_api_key_private_key>
+  LIGHTER_ACCOUNT_INDEX=<your_account_index>
+  LIGHTER_API_KEY_INDEX=<your_api_key_index>
+
+  # Cross-Exchange Hedge Bot Configuration
+  CROSS_HEDGE_MARGIN=<margin_in_usdc>
+  CROSS_HEDGE_POSITION_HOLD_TIME=<hold_time_seconds>
+  CROSS_HEDGE_TAKE_PROFIT=<take_profit_percentage> (optional, default 50)
+  CROSS_HEDGE_STOP_LOSS=<stop_loss_percentage> (optional, default 50)
+  CROSS_HEDGE_REVERSE=false (optional, default false)
+  CROSS_HEDGE_CYCLE_WAIT=20 (optional, default 20)"""
+
+
+def print_env_help():
+    """Print the expected .env layout after a configuration error."""
+    print(_ENV_HELP)
 
 
 async def main():
@@ -107,32 +163,25 @@ async def main():
 
     dotenv.load_dotenv(args.env_file)
 
-    # Validate environment variables
-    validate_env_variables()
-
-    # Get configuration from args or environment
-    margin = args.margin if args.margin else Decimal(os.getenv('CROSS_HEDGE_MARGIN', '100'))
-    hold_time = args.hold_time if args.hold_time else int(os.getenv('CROSS_HEDGE_POSITION_HOLD_TIME', '300'))
-    take_profit = args.take_profit if args.take_profit else Decimal(os.getenv('CROSS_HEDGE_TAKE_PROFIT', '50'))
-    stop_loss = args.stop_loss if args.stop_loss else Decimal(os.getenv('CROSS_HEDGE_STOP_LOSS', '50'))
-    reverse = os.getenv('CROSS_HEDGE_REVERSE', 'false').lower() == 'true'
-    cycle_wait = int(os.getenv('CROSS_HEDGE_CYCLE_WAIT', '20'))
-
-    # Get absolute USDC stop loss and take profit (new parameters)
-    max_loss_usdc = Decimal(os.getenv('CROSS_HEDGE_MAX_LOSS_USDC', '50'))
-    max_profit_usdc = Decimal(os.getenv('CROSS_HEDGE_MAX_PROFIT_USDC', '100'))
+    # Validate and coerce all environment configuration in one pass
+    try:
+        env = CrossHedgeEnv.from_env(args)
+    except ConfigError as e:
+        print(f"Error: Missing required environment variables: {e}")
+        print_env_help()
+        sys.exit(1)
 
     # Create configuration
     config = CrossHedgeConfig(
         ticker=args.ticker.upper(),
-        margin=margin,
-        hold_time=hold_time,
-        take_profit=take_profit,
-        stop_loss=stop_loss,
-        max_loss_usdc=max_loss_usdc,
-        max_profit_usdc=max_profit_usdc,
-        reverse=reverse,
-        cycle_wait=cycle_wait
+        margin=env.margin,
+        hold_time=env.hold_time,
+        take_profit=env.take_profit,
+        stop_loss=env.stop_loss,
+        max_loss_usdc=env.max_loss_usdc,
+        max_profit_usdc=env.max_profit_usdc,
+        reverse=env.reverse,
+        cycle_wait=env.cycle_wait
     )
 
     # Create and run the bot
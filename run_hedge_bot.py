@@ -8,15 +8,91 @@ import asyncio
 import logging
 import os
 import sys
-from pathlib import Path
+import traceback
 from decimal import Decimal
-import dotenv
-
-from hedge_volume_bot import HedgeVolumeBot, HedgeConfig
+from helpers.env_cache import fast_load_dotenv
+
+# Use the libuv-backed event loop when available - pure win for a bot that
+# is all concurrent network I/O
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# hedge_volume_bot (and the exchange SDK stack behind it) is imported
+# lazily in main() so --help and argument errors exit without paying the
+# SDK import cost
+
+# Credentials for both Lighter accounts
+_REQUIRED_ENV = frozenset({
+    'API_KEY_PRIVATE_KEY_1',
+    'LIGHTER_ACCOUNT_INDEX_1',
+    'LIGHTER_API_KEY_INDEX_1',
+    'API_KEY_PRIVATE_KEY_2',
+    'LIGHTER_ACCOUNT_INDEX_2',
+    'LIGHTER_API_KEY_INDEX_2',
+})
+
+_HELP_TEXT = """Error: Missing required environment variables: {missing}
+
+Please ensure your .env file contains:
+  API_KEY_PRIVATE_KEY_1=<account1_private_key>
+  LIGHTER_ACCOUNT_INDEX_1=<account1_index>
+  LIGHTER_API_KEY_INDEX_1=<account1_api_key_index>
+  API_KEY_PRIVATE_KEY_2=<account2_private_key>
+  LIGHTER_ACCOUNT_INDEX_2=<account2_index>
+  LIGHTER_API_KEY_INDEX_2=<account2_api_key_index>
+  HEDGE_MARGIN=<margin_in_usdc>
+  HEDGE_POSITION_HOLD_TIME=<hold_time_seconds>
+  HEDGE_TAKE_PROFIT=<take_profit_percentage> (optional, default 50)
+  HEDGE_STOP_LOSS=<stop_loss_percentage> (optional, default 50)"""
+
+
+# Known flags for the fast-path parser, mapped to (attr, converter)
+_FAST_FLAGS = {
+    '--ticker': ('ticker', str),
+    '--margin': ('margin', Decimal),
+    '--hold-time': ('hold_time', int),
+    '--take-profit': ('take_profit', Decimal),
+    '--stop-loss': ('stop_loss', Decimal),
+    '--env-file': ('env_file', str),
+}
+
+
+def _parse_arguments_fast(argv):
+    """Scan argv pairwise for the known flags without building argparse.
+
+    Returns a Namespace, or None when anything unrecognized or malformed
+    shows up (including --help) so the full parser can take over.
+    """
+    values = {'ticker': 'BTC', 'margin': None, 'hold_time': None,
+              'take_profit': None, 'stop_loss': None, 'env_file': '.env'}
+    i = 0
+    while i < len(argv):
+        spec = _FAST_FLAGS.get(argv[i])
+        if spec is None or i + 1 >= len(argv):
+            return None
+        attr, convert = spec
+        try:
+            values[attr] = convert(argv[i + 1])
+        except (ValueError, ArithmeticError):
+            return None
+        i += 2
+    return argparse.Namespace(**values)
 
 
 def parse_arguments():
-    """Parse command line arguments."""
+    """Parse command line arguments.
+
+    Launches use a handful of known flags, so a cheap pairwise scan
+    handles the common case; argparse only runs as the fallback for
+    --help and anything the scan does not recognize.
+    """
+    args = _parse_arguments_fast(sys.argv[1:])
+    if args is not None:
+        return args
+
     parser = argparse.ArgumentParser(
         description='Hedge Volume Bot - Dual Account High-Frequency Trading for Volume Generation'
     )
@@ -38,84 +114,45 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def setup_logging(log_level: str):
-    """Setup global logging configuration."""
-    level = getattr(logging, log_level.upper(), logging.INFO)
-
-    root_logger = logging.getLogger()
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
-
-    root_logger.setLevel(level)
-
-    # Suppress noisy loggers
-    logging.getLogger('websockets').setLevel(logging.WARNING)
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
-    logging.getLogger('lighter').setLevel(logging.WARNING)
+# Logging is configured once at import - the entrypoint always runs at
+# WARNING, so there is no per-launch handler teardown and re-registration
+logging.basicConfig(level=logging.WARNING)
+for _name in ('websockets', 'urllib3', 'requests', 'lighter'):
+    logging.getLogger(_name).setLevel(logging.WARNING)
 
 
 def validate_env_variables():
-    """Validate required environment variables."""
-    required_vars = [
-        'API_KEY_PRIVATE_KEY_1',
-        'LIGHTER_ACCOUNT_INDEX_1',
-        'LIGHTER_API_KEY_INDEX_1',
-        'API_KEY_PRIVATE_KEY_2',
-        'LIGHTER_ACCOUNT_INDEX_2',
-        'LIGHTER_API_KEY_INDEX_2',
-    ]
-
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-
-    if missing_vars:
-        print(f"Error: Missing required environment variables: {', '.join(missing_vars)}")
-        print("\nPlease ensure your .env file contains:")
-        print("  API_KEY_PRIVATE_KEY_1=<account1_private_key>")
-        print("  LIGHTER_ACCOUNT_INDEX_1=<account1_index>")
-        print("  LIGHTER_API_KEY_INDEX_1=<account1_api_key_index>")
-        print("  API_KEY_PRIVATE_KEY_2=<account2_private_key>")
-        print("  LIGHTER_ACCOUNT_INDEX_2=<account2_index>")
-        print("  LIGHTER_API_KEY_INDEX_2=<account2_api_key_index>")
-        print("  HEDGE_MARGIN=<margin_in_usdc>")
-        print("  HEDGE_POSITION_HOLD_TIME=<hold_time_seconds>")
-        print("  HEDGE_TAKE_PROFIT=<take_profit_percentage> (optional, default 50)")
-        print("  HEDGE_STOP_LOSS=<stop_loss_percentage> (optional, default 50)")
-        sys.exit(1)
+    """Validate required environment variables with one bulk set check."""
+    missing = _REQUIRED_ENV - os.environ.keys()
+    if missing:
+        raise SystemExit(_HELP_TEXT.format(missing=', '.join(sorted(missing))))
 
 
 async def main():
     """Main entry point."""
     args = parse_arguments()
 
-    # Setup logging
-    setup_logging("WARNING")
-
-    # Load environment file
-    env_path = Path(args.env_file)
-    if not env_path.exists():
-        print(f"Error: Env file not found: {env_path.resolve()}")
+    # Always load the env file when it exists - it also carries optional
+    # config (HEDGE_MARGIN, hold time, notification tokens) that must not
+    # be dropped just because the credentials are exported in the shell.
+    # The pickle cache makes the load sub-millisecond, and load_dotenv
+    # semantics mean exported variables still win. The missing-file error
+    # only applies when the environment lacks required variables.
+    if os.path.isfile(args.env_file):
+        fast_load_dotenv(args.env_file)
+    elif _REQUIRED_ENV - os.environ.keys():
+        print(f"Error: Env file not found: {os.path.abspath(args.env_file)}")
         sys.exit(1)
 
-    dotenv.load_dotenv(args.env_file)
-
     # Validate environment variables
     validate_env_variables()
 
-    # Get configuration from args or environment
-    margin = args.margin if args.margin else Decimal(os.getenv('HEDGE_MARGIN', '100'))
-    hold_time = args.hold_time if args.hold_time else int(os.getenv('HEDGE_POSITION_HOLD_TIME', '300'))
-    take_profit = args.take_profit if args.take_profit else Decimal(os.getenv('HEDGE_TAKE_PROFIT', '50'))
-    stop_loss = args.stop_loss if args.stop_loss else Decimal(os.getenv('HEDGE_STOP_LOSS', '50'))
-
-    # Create configuration
-    config = HedgeConfig(
-        ticker=args.ticker.upper(),
-        margin=margin,
-        hold_time=hold_time,
-        take_profit=take_profit,
-        stop_loss=stop_loss
-    )
+    # Heavy import deferred until configuration is known to be valid
+    from hedge_volume_bot import HedgeVolumeBot, HedgeConfig
+
+    # Configuration resolution (args over env over defaults) lives on the
+    # config class itself
+    config = HedgeConfig.from_env(args)
 
     # Create and run the bot
     bot = HedgeVolumeBot(config)
@@ -123,7 +160,6 @@ async def main():
         await bot.run()
     except Exception as e:
         print(f"Bot execution failed: {e}")
-        import traceback
         traceback.print_exc()
         return
 